@@ -0,0 +1,301 @@
+"""
+Shared AWS handles for the BugTracker maintenance scripts.
+Sessions and DynamoDB tables are built once per process and reused, so the
+credential lookup, endpoint resolution and HTTP connection pool are shared.
+"""
+
+import functools
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+
+import boto3
+from boto3.dynamodb.conditions import ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
+
+# Named profile from the environment (e.g. AWS_PROFILE=AdministratorAccess12hr-100142810612
+# for the SSO login); unset means the default chain: env keys, instance or task role
+AWS_PROFILE = os.getenv('AWS_PROFILE')
+AWS_REGION = 'us-west-2'
+BUG_TRACKER_TABLE = 'BugTracker-evt-bugtracker'
+
+# Optional read budget (RCU/s) for cleanup scans, unthrottled when unset
+TARGET_RCU = float(os.environ['CLEANUP_TARGET_RCU']) if os.getenv('CLEANUP_TARGET_RCU') else None
+
+# BatchWriteItem accepts at most 25 requests per call; the cap is per call,
+# so many 25-item calls can be in flight at once
+BATCH_WRITE_LIMIT = 25
+
+# Parallel scan segments used by parallel_scan_pages (one thread each)
+SCAN_SEGMENTS = 16
+
+# Scanned pages allowed to wait for the consumer before the segments pause
+SCAN_QUEUE_PAGES = 32
+
+# Concurrent BatchWriteItem calls used by batch_delete_keys and batch_put_items
+BATCH_WRITE_WORKERS = 16
+
+# Upper bound on concurrent BatchWriteItem calls (stays within the connection pool)
+MAX_DELETE_WORKERS = 32
+
+# BatchWriteItem calls per batch before its unprocessed items are given up on,
+# so a run against an exhausted table fails instead of spinning forever
+BATCH_MAX_ATTEMPTS = 8
+
+# Large enough pool for parallel scans/deletes, adaptive retries for throttling,
+# and TCP keep-alive so pooled connections survive pauses between pages.
+# urllib3 already sets TCP_NODELAY on every connection it opens.
+DYNAMODB_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
+# One shared serializer for low-level request values
+_serializer = TypeSerializer()
+
+# DynamoDB numbers hold up to 38 significant digits
+_MAX_FAST_INT = 10 ** 38
+
+
+@functools.lru_cache(maxsize=None)
+def get_session(profile_name=AWS_PROFILE):
+    """Return the boto3 session for a profile (None for the default chain)."""
+    return boto3.Session(profile_name=profile_name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_dynamodb(region_name=AWS_REGION, profile_name=AWS_PROFILE):
+    """Return the DynamoDB resource for a region and profile."""
+    return get_session(profile_name).resource(
+        'dynamodb',
+        region_name=region_name,
+        config=DYNAMODB_CONFIG
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_table(name=BUG_TRACKER_TABLE, region_name=AWS_REGION, profile_name=AWS_PROFILE):
+    """Return a DynamoDB Table handle, reusing the cached resource."""
+    return get_dynamodb(region_name, profile_name).Table(name)
+
+
+def rate_limited_pages(operation, target_rcu=None, **kwargs):
+    """
+    Yield every response page of a table scan or query.
+    When target_rcu is set, sleep between pages so the consumed read capacity
+    stays near target_rcu units per second instead of bursting into throttles.
+    """
+    if target_rcu:
+        kwargs['ReturnConsumedCapacity'] = 'TOTAL'
+    last = time.monotonic()
+    
+    while True:
+        response = operation(**kwargs)
+        yield response
+        
+        if target_rcu:
+            consumed = response.get('ConsumedCapacity', {}).get('CapacityUnits', 0)
+            wanted = consumed / target_rcu
+            elapsed = time.monotonic() - last
+            if wanted > elapsed:
+                time.sleep(wanted - elapsed)
+            last = time.monotonic()
+        
+        if 'LastEvaluatedKey' not in response:
+            return
+        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def serialize_value(value):
+    """
+    Serialize a Python value to DynamoDB attribute-value form. Plain str, bool
+    and int, the bulk of every item, are mapped directly, skipping
+    TypeSerializer's type probing; everything else goes through TypeSerializer.
+    """
+    cls = type(value)
+    if cls is str:
+        return {'S': value}
+    if cls is bool:
+        return {'BOOL': value}
+    if cls is int and -_MAX_FAST_INT < value < _MAX_FAST_INT:
+        return {'N': str(value)}
+    return _serializer.serialize(value)
+
+
+def client_read_kwargs(table, **kwargs):
+    """
+    Translate resource-style scan/query kwargs for table.meta.client.
+    Condition objects become expression strings with serialized values, so the
+    low-level call can skip the resource layer's per-item deserialization.
+    """
+    builder = ConditionExpressionBuilder()
+    kwargs = dict(kwargs, TableName=table.name)
+    names = dict(kwargs.pop('ExpressionAttributeNames', {}))
+    values = {}
+    
+    for param, is_key_condition in (('KeyConditionExpression', True), ('FilterExpression', False)):
+        condition = kwargs.get(param)
+        if condition is None or isinstance(condition, str):
+            continue
+        expression = builder.build_expression(condition, is_key_condition=is_key_condition)
+        kwargs[param] = expression.condition_expression
+        names.update(expression.attribute_name_placeholders)
+        values.update(
+            (placeholder, serialize_value(value))
+            for placeholder, value in expression.attribute_value_placeholders.items()
+        )
+    
+    if names:
+        kwargs['ExpressionAttributeNames'] = names
+    if values:
+        kwargs['ExpressionAttributeValues'] = values
+    return kwargs
+
+
+def parallel_scan_pages(table, total_segments=SCAN_SEGMENTS, target_rcu=None,
+                        max_pending_pages=SCAN_QUEUE_PAGES, low_level=False, **scan_kwargs):
+    """
+    Yield scan response pages from total_segments segments scanned in parallel.
+    Pages arrive in completion order; target_rcu is split evenly across segments.
+    At most max_pending_pages wait in the queue, so a slow consumer (e.g. the
+    batch deletes) pauses the scanners instead of letting pages pile up.
+    With low_level, pages come from the client and items stay in raw
+    {'S': ...} attribute-value form.
+    """
+    scan = table.scan
+    if low_level:
+        scan = table.meta.client.scan
+        scan_kwargs = client_read_kwargs(table, **scan_kwargs)
+    
+    pages = queue.Queue(maxsize=max_pending_pages)
+    stop = threading.Event()
+    segment_rcu = target_rcu / total_segments if target_rcu else None
+    
+    def put(page):
+        # Give up once the consumer has gone away, rather than blocking forever
+        while not stop.is_set():
+            try:
+                pages.put(page, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+    
+    def scan_segment(segment):
+        try:
+            for response in rate_limited_pages(
+                scan, segment_rcu,
+                Segment=segment, TotalSegments=total_segments, **scan_kwargs
+            ):
+                if stop.is_set():
+                    return
+                put(response)
+        finally:
+            # Tell the consumer this segment is done
+            put(None)
+    
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        futures = [executor.submit(scan_segment, segment) for segment in range(total_segments)]
+        
+        try:
+            finished_segments = 0
+            while finished_segments < total_segments:
+                page = pages.get()
+                if page is None:
+                    finished_segments += 1
+                    continue
+                yield page
+        finally:
+            stop.set()
+        
+        # Surface the first segment error, if any
+        for future in futures:
+            future.result()
+
+
+def _write_batch(client, request_items, max_backoff=1.0, max_attempts=BATCH_MAX_ATTEMPTS):
+    """
+    Send one BatchWriteItem call and resend unprocessed items with jittered
+    exponential backoff. Returns how many retries throttling forced; raises
+    once max_attempts calls still leave items unprocessed.
+    """
+    attempt = 0
+    
+    while request_items:
+        response = client.batch_write_item(RequestItems=request_items)
+        request_items = response.get('UnprocessedItems')
+        if request_items:
+            if attempt + 1 >= max_attempts:
+                remaining = sum(len(requests) for requests in request_items.values())
+                raise RuntimeError(f"{remaining} write requests still unprocessed after {max_attempts} BatchWriteItem attempts")
+            # Full jitter so throttled workers do not retry in lockstep
+            time.sleep(random.uniform(0, min(max_backoff, 0.05 * 2 ** attempt)))
+            attempt += 1
+    
+    return attempt
+
+
+def _batch_write(table, write_requests, max_workers):
+    """
+    Send low-level write requests in concurrent 25-request BatchWriteItem calls
+    and yield the running written count each time a batch completes.
+    Batches in flight are halved whenever one comes back throttled and grow
+    back one at a time while batches go through cleanly.
+    """
+    client = table.meta.client
+    write_requests = iter(write_requests)
+    written_count = 0
+    pending = {}
+    max_in_flight = max_workers * 2
+    in_flight = max_in_flight
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            batch = list(islice(write_requests, BATCH_WRITE_LIMIT))
+            
+            if batch:
+                future = executor.submit(_write_batch, client, {table.name: batch})
+                pending[future] = len(batch)
+            
+            # Wait while too many batches are in flight, and drain them all at the end
+            while pending and (not batch or len(pending) >= in_flight):
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.result():
+                        in_flight = max(1, in_flight // 2)
+                    else:
+                        in_flight = min(max_in_flight, in_flight + 1)
+                    written_count += pending.pop(future)
+                    yield written_count
+            
+            if not batch:
+                return
+
+
+def batch_delete_keys(table, keys, max_workers=BATCH_WRITE_WORKERS):
+    """
+    Delete (PK, SK) keys with concurrent low-level BatchWriteItem calls.
+    keys may be any iterable, including a stream still being scanned. Yields
+    the running deleted count each time a 25-key batch completes.
+    """
+    return _batch_write(table, (
+        {'DeleteRequest': {'Key': {'PK': serialize_value(pk), 'SK': serialize_value(sk)}}}
+        for pk, sk in keys
+    ), max_workers)
+
+
+def batch_put_items(table, items, max_workers=BATCH_WRITE_WORKERS):
+    """
+    Put items (plain dicts, as for table.put_item) with concurrent low-level
+    BatchWriteItem calls. Yields the running written count each time a
+    25-item batch completes.
+    """
+    return _batch_write(table, (
+        {'PutRequest': {'Item': {name: serialize_value(value) for name, value in item.items()}}}
+        for item in items
+    ), max_workers)
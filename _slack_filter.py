@@ -0,0 +1,32 @@
+"""
+Shared Slack message classification for the BugTracker cleanup scripts.
+Patterns are compiled once and match case-insensitively without building an
+upper-cased copy of every message.
+"""
+
+import re
+
+# Main bug report format
+AUTHOR_RE = re.compile(r'AUTHOR', re.IGNORECASE)
+
+# Incomplete template indicators, and the unfilled user-info line they come with
+TEMPLATE_RE = re.compile(
+    r'\*CASTING COMPANY\*|\*AFFECTED USER\*|ALESSI HARTIGAN|GENERAL / NO SPECIFIC CLIENT',
+    re.IGNORECASE
+)
+USERINFO_RE = re.compile(r"\*USER'S INFO \(NAME / (CONTACT|CO\.\.\.)", re.IGNORECASE)
+
+
+def is_valid_bug_report(text):
+    """Check if a Slack message is a valid bug report."""
+    # Keep messages that contain "AUTHOR" (main bug report format)
+    if AUTHOR_RE.search(text):
+        return True
+    
+    # Templates with an unfilled user-info line are not real bug reports
+    if TEMPLATE_RE.search(text) and USERINFO_RE.search(text):
+        return False
+    
+    # Keep messages that might be legitimate bug reports with different formats
+    # You can add more criteria here if needed
+    return False
@@ -4,111 +4,71 @@ Automatic cleanup script to delete Slack records without 'AUTHOR'.
 No user input required - runs automatically.
 """
 
-import boto3
-import time
 import sys
+from boto3.dynamodb.conditions import Attr, Key
 
-# Configure AWS session
-session = boto3.Session(profile_name='AdministratorAccess12hr-100142810612')
-dynamodb = session.resource('dynamodb', region_name='us-west-2')
-table = dynamodb.Table('BugTracker-evt-bugtracker')
+from _aws import TARGET_RCU, get_table, rate_limited_pages
+from _slack_filter import AUTHOR_RE
+from slack_cleanup import scan_and_delete
+
+# Number of parallel scan segments (one worker thread per segment)
+SCAN_SEGMENTS = 8
+
+# Shared, cached AWS handles (connection pool sized for the scan segments)
+table = get_table()
+
+# Filter conditions built once and reused by every scan and query below
+_SL_FILTER = Attr('PK').begins_with('SL-')
+# contains() is case-sensitive, so cover both spellings seen in Slack
+_HAS_AUTHOR = Attr('text').contains('AUTHOR') | Attr('text').contains('author')
 
 def scan_and_delete_slack_without_author():
     """Scan and delete Slack records without AUTHOR in one pass."""
     print("🧹 Starting automatic Slack cleanup...")
     print("Scanning for Slack records without 'AUTHOR'...")
     
-    deleted_count = 0
-    total_scanned = 0
-    batch_items = []
-    
-    # Scan the table in chunks
-    paginator = table.scan()
-    
-    while True:
-        try:
-            # Process current page
-            items = paginator.get('Items', [])
-            total_scanned += len(items)
-            
-            for item in items:
-                pk = item.get('PK', '')
-                
-                # Check if it's a Slack record
-                if pk.startswith('SL-'):
-                    text = item.get('text', '')
-                    
-                    # Check if it does NOT contain 'AUTHOR'
-                    if 'AUTHOR' not in text.upper():
-                        batch_items.append(item)
-                        
-                        # Delete in batches of 25
-                        if len(batch_items) >= 25:
-                            delete_batch(batch_items)
-                            deleted_count += len(batch_items)
-                            batch_items = []
-                            print(f"Deleted {deleted_count} Slack records without 'AUTHOR'...")
-            
-            # Check if there are more pages
-            if 'LastEvaluatedKey' not in paginator:
-                break
-                
-            # Get next page
-            paginator = table.scan(ExclusiveStartKey=paginator['LastEvaluatedKey'])
-            
-        except Exception as e:
-            print(f"Error during scan: {e}")
-            break
-    
-    # Delete remaining items in batch
-    if batch_items:
-        delete_batch(batch_items)
-        deleted_count += len(batch_items)
+    # DynamoDB drops non-Slack records and the AUTHOR/author spellings; the rest
+    # come back with their text so the final case-insensitive check keeps
+    # spellings contains() misses, such as 'Author'
+    deleted_count, kept_count, total_scanned = scan_and_delete(
+        lambda item: not AUTHOR_RE.search(item.get('text', '')),
+        filter_expression=_SL_FILTER & ~_HAS_AUTHOR,
+        projection='PK, SK, #t',
+        total_segments=SCAN_SEGMENTS,
+        label="Slack records without 'AUTHOR'"
+    )
     
     print(f"\n✅ Cleanup completed!")
     print(f"- Total records scanned: {total_scanned}")
     print(f"- Slack records deleted: {deleted_count}")
     
-    return deleted_count
+    return deleted_count, kept_count
 
-def delete_batch(items):
-    """Delete a batch of items."""
-    try:
-        with table.batch_writer() as batch:
-            for item in items:
-                batch.delete_item(
-                    Key={
-                        'PK': item['PK'],
-                        'SK': item['SK']
-                    }
-                )
-        time.sleep(0.1)  # Small delay to avoid throttling
-    except Exception as e:
-        print(f"Error deleting batch: {e}")
+def count_slack_with_author():
+    """Count the SL-* records with AUTHOR that the cleanup kept, via the source-index GSI."""
+    total = 0
+    query_kwargs = {
+        'IndexName': 'source-index',
+        'KeyConditionExpression': Key('sourceSystem').eq('slack'),
+        'FilterExpression': _SL_FILTER & _HAS_AUTHOR,
+        'Select': 'COUNT'
+    }
+    
+    for response in rate_limited_pages(table.query, TARGET_RCU, **query_kwargs):
+        total += response.get('Count', 0)
+    
+    return total
 
-def verify_results():
-    """Quick verification of results."""
+def verify_results(deleted_count, kept_count):
+    """Report the delete pass counters and the number of Slack records kept."""
     print("\n🔍 Verifying results...")
     
-    slack_with_author = 0
-    slack_without_author = 0
-    
+    # The delete pass already removed every match, so only the kept side needs a
+    # count: the AUTHOR/author records filtered out server-side plus the other
+    # spellings the delete pass kept
     try:
-        response = table.scan()
-        items = response.get('Items', [])
-        
-        # Process first page only for quick check
-        for item in items:
-            pk = item.get('PK', '')
-            if pk.startswith('SL-'):
-                text = item.get('text', '')
-                if 'AUTHOR' in text.upper():
-                    slack_with_author += 1
-                else:
-                    slack_without_author += 1
-        
-        print(f"Sample check - Slack with AUTHOR: {slack_with_author}")
-        print(f"Sample check - Slack without AUTHOR: {slack_without_author}")
+        print(f"Slack with AUTHOR (kept): {count_slack_with_author() + kept_count}")
+        print(f"Slack without AUTHOR (deleted): {deleted_count}")
         
     except Exception as e:
         print(f"Error during verification: {e}")
@@ -119,10 +79,10 @@ def main():
     print("No confirmation required - running automatically\n")
     
     try:
-        deleted_count = scan_and_delete_slack_without_author()
+        deleted_count, kept_count = scan_and_delete_slack_without_author()
         
         if deleted_count > 0:
-            verify_results()
+            verify_results(deleted_count, kept_count)
             print("\n🎉 Dashboard should now show correct proportions!")
             print("- Fewer Slack records (only bug reports)")
             print("- Zendesk should be the highest source")
@@ -22,6 +22,8 @@ const Dashboard = () => {
 
   // Initialize DynamoDB client
   const client = new DynamoDBClient({ region: 'us-west-2' });
+  // Same table dynamodb_data_storage.py writes (its DYNAMODB_TABLE)
+  const tableName = process.env.REACT_APP_DYNAMODB_TABLE || 'support_data_ingestion_v2';
   const docClient = DynamoDBDocumentClient.from(client);
 
   useEffect(() => {
@@ -34,7 +36,7 @@ const Dashboard = () => {
       
       // Fetch all data from DynamoDB
       const scanCommand = new ScanCommand({
-        TableName: 'support_data_ingestion',
+        TableName: tableName,
         Limit: 1000
       });
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+One-off backfill for the sparse unlinked-index.
+Ingestion only sets unlinkedFlag on the Slack messages it re-fetches, so SL-*
+records written before the index existed are missing from it and from
+list_unlinked_slack_bugs. This sets the flag on every SL-* record that is not
+soft-linked; run it once after unlinked-index is ACTIVE.
+
+Usage:
+    python backfill_unlinked_flag.py
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from boto3.dynamodb.conditions import Attr, Key
+
+from _aws import BATCH_WRITE_WORKERS, TARGET_RCU, get_table, rate_limited_pages
+
+# Shared, cached AWS handles (adaptive retries handle throttling)
+table = get_table()
+
+# Value every unlinked Slack record carries (see bug_tracker_linker.UNLINKED_FLAG)
+UNLINKED_FLAG = 'SL'
+
+# Unlinked SL-* records still missing the flag; linked Slack rows are re-keyed
+# to ZD-* and soft-linked ones carry linkedTicketId
+_NEEDS_FLAG = (
+    Attr('PK').begins_with('SL-')
+    & Attr('unlinkedFlag').not_exists()
+    & Attr('linkedTicketId').not_exists()
+)
+
+def flag_record(key):
+    """Set unlinkedFlag on one record; returns False if it was deleted or linked meanwhile."""
+    try:
+        table.update_item(
+            Key=key,
+            UpdateExpression='SET unlinkedFlag = :flag',
+            ConditionExpression=Attr('PK').exists() & Attr('linkedTicketId').not_exists(),
+            ExpressionAttributeValues={':flag': UNLINKED_FLAG}
+        )
+        return True
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        return False
+
+def backfill_unlinked_flag():
+    """Flag every unlinked SL-* record, reading only Slack rows through the source-index GSI."""
+    print("🏷️  Backfilling unlinkedFlag on Slack records...")
+    
+    query_kwargs = {
+        'IndexName': 'source-index',
+        'KeyConditionExpression': Key('sourceSystem').eq('slack'),
+        'FilterExpression': _NEEDS_FLAG,
+        'ProjectionExpression': 'PK, SK'
+    }
+    keys = (
+        item
+        for page in rate_limited_pages(table.query, TARGET_RCU, **query_kwargs)
+        for item in page['Items']
+    )
+    
+    flagged_count = 0
+    skipped_count = 0
+    with ThreadPoolExecutor(max_workers=BATCH_WRITE_WORKERS) as executor:
+        for flagged in executor.map(flag_record, keys):
+            if flagged:
+                flagged_count += 1
+                if flagged_count % 100 == 0:
+                    print(f"Flagged {flagged_count} Slack records...")
+            else:
+                skipped_count += 1
+    
+    print(f"\n✅ Backfill completed!")
+    print(f"- Slack records flagged: {flagged_count}")
+    print(f"- Skipped (deleted or linked meanwhile): {skipped_count}")
+    
+    return flagged_count
+
+def main():
+    print("🚀 UNLINKED-INDEX BACKFILL")
+    print("=" * 30)
+    backfill_unlinked_flag()
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,9 @@
 import os
 import re
 import boto3
-import json
-import time
+import hashlib
 from datetime import datetime
+from decimal import Decimal
 from dotenv import load_dotenv
 import requests
 
@@ -26,6 +26,26 @@ SHORTCUT_API_TOKEN = os.getenv("SHORTCUT_API_TOKEN")
 dynamodb = boto3.resource('dynamodb', region_name=AWS_REGION)
 dynamodb_client = boto3.client('dynamodb', region_name=AWS_REGION)
 
+# Slack message fields, compiled once with the case-insensitive flag baked in
+TICKET_ID_RE = re.compile(r"ticketId[:=]\s*(\S+)", re.IGNORECASE)
+PRIORITY_RE = re.compile(r"priority[:=]\s*(\S+)", re.IGNORECASE)
+
+
+def text_digest(text):
+    """Stable 64-bit BLAKE2b hex digest of text, the same in every process (unlike hash())."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def dynamodb_value(value):
+    """Convert a value for DynamoDB: floats become Decimal, dicts and lists stay native Maps and Lists."""
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: dynamodb_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [dynamodb_value(item) for item in value]
+    return value
+
 
 class BugTrackerDynamoDB:
     def __init__(self):
@@ -81,6 +101,18 @@ class BugTrackerDynamoDB:
                     {
                         'AttributeName': 'createdAt',
                         'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'unlinkedFlag',
+                        'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'linkedTicketId',
+                        'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'syncedAt',
+                        'AttributeType': 'S'
                     }
                 ],
                 GlobalSecondaryIndexes=[
@@ -131,6 +163,57 @@ class BugTrackerDynamoDB:
                         'Projection': {
                             'ProjectionType': 'ALL'
                         }
+                    },
+                    {
+                        # Sparse: only unlinked Slack records carry unlinkedFlag
+                        'IndexName': 'unlinked-index',
+                        'KeySchema': [
+                            {
+                                'AttributeName': 'unlinkedFlag',
+                                'KeyType': 'HASH'
+                            },
+                            {
+                                'AttributeName': 'createdAt',
+                                'KeyType': 'RANGE'
+                            }
+                        ],
+                        'Projection': {
+                            'ProjectionType': 'ALL'
+                        }
+                    },
+                    {
+                        # Sparse: only soft-linked records carry linkedTicketId
+                        'IndexName': 'linked-index',
+                        'KeySchema': [
+                            {
+                                'AttributeName': 'linkedTicketId',
+                                'KeyType': 'HASH'
+                            },
+                            {
+                                'AttributeName': 'createdAt',
+                                'KeyType': 'RANGE'
+                            }
+                        ],
+                        'Projection': {
+                            'ProjectionType': 'ALL'
+                        }
+                    },
+                    {
+                        # Keys only: stale-record checks need just PK, SK and syncedAt
+                        'IndexName': 'stale-index',
+                        'KeySchema': [
+                            {
+                                'AttributeName': 'sourceSystem',
+                                'KeyType': 'HASH'
+                            },
+                            {
+                                'AttributeName': 'syncedAt',
+                                'KeyType': 'RANGE'
+                            }
+                        ],
+                        'Projection': {
+                            'ProjectionType': 'KEYS_ONLY'
+                        }
                     }
                 ],
                 BillingMode='PAY_PER_REQUEST'
@@ -171,10 +254,7 @@ class BugTrackerDynamoDB:
             # Add all other attributes
             for key, value in attributes.items():
                 if key not in ['PK', 'SK', 'sourceSystem', 'createdAt', 'updatedAt']:
-                    if isinstance(value, (dict, list)):
-                        item[key] = json.dumps(value)
-                    else:
-                        item[key] = value
+                    item[key] = dynamodb_value(value)
             
             # Upsert the item
             self.table.put_item(Item=item)
@@ -250,10 +330,10 @@ class BugDataIngestion:
     
     def extract_ticket_info_from_slack(self, text):
         """Extract ticketId and priority if available, fallback if not."""
-        ticket_pattern = re.search(r"ticketId[:=]\s*(\S+)", text, re.IGNORECASE)
-        priority_pattern = re.search(r"priority[:=]\s*(\S+)", text, re.IGNORECASE)
+        ticket_pattern = TICKET_ID_RE.search(text)
+        priority_pattern = PRIORITY_RE.search(text)
 
-        ticket_id = ticket_pattern.group(1) if ticket_pattern else f"SL-{hash(text)}"
+        ticket_id = ticket_pattern.group(1) if ticket_pattern else f"SL-{text_digest(text)}"
         priority = priority_pattern.group(1).capitalize() if priority_pattern else "Unknown"
 
         return ticket_id, priority
@@ -276,13 +356,17 @@ class BugDataIngestion:
             for msg in messages:
                 text = msg.get("text", "")
                 ticket_id, priority = self.extract_ticket_info_from_slack(text)
-                msg_id = msg.get("ts", str(time.time()))
+                # ts is both the message id and its epoch seconds; read and parse it once
+                msg_id = msg.get("ts")
+                if not msg_id:
+                    continue
+                posted_at = datetime.fromtimestamp(float(msg_id)).isoformat()
 
                 bug_data = {
                     "author": msg.get("user", "unknown"),
                     "text": text,
                     "priority": priority,
-                    "createdAt": datetime.fromtimestamp(float(msg["ts"])).isoformat()
+                    "createdAt": posted_at
                 }
                 
                 self.dynamodb.upsert_bug_item(ticket_id, "slack", msg_id, bug_data)
@@ -300,17 +384,19 @@ class BugDataIngestion:
         print("🎫 Fetching Zendesk tickets...")
         
         try:
-            url = f"https://{ZENDESK_SUBDOMAIN}.zendesk.com/api/v2/tickets.json"
+            # Let Zendesk filter to bug-tagged tickets instead of downloading them all
+            url = f"https://{ZENDESK_SUBDOMAIN}.zendesk.com/api/v2/search.json"
+            params = {"query": "type:ticket tags:bug"}
             auth = (f"{ZENDESK_EMAIL}/token", ZENDESK_API_TOKEN)
-            response = requests.get(url, auth=auth, timeout=10)
+            response = requests.get(url, params=params, auth=auth, timeout=10)
             response.raise_for_status()
 
             data = response.json()
-            tickets = data.get("tickets", [])
+            tickets = data.get("results", [])
             results = []
 
             for t in tickets:
-                if "bug" not in (t.get("tags") or []):  # filter only bug tickets
+                if "bug" not in (t.get("tags") or ()):  # guard; the search already filters on the tag
                     continue
 
                 ticket_id = f"ZD-{t['id']}"
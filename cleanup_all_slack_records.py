@@ -4,69 +4,68 @@ Script to clean up ALL Slack records in DynamoDB and re-ingest with proper AUTHO
 This will remove all the duplicate and non-bug-report Slack messages.
 """
 
-import boto3
-import json
+import orjson
 from decimal import Decimal
 import time
+from boto3.dynamodb.conditions import Attr, Key
 
-# Configure AWS session
-session = boto3.Session(profile_name='AdministratorAccess12hr-100142810612')
-dynamodb = session.resource('dynamodb', region_name='us-west-2')
-table = dynamodb.Table('BugTracker-evt-bugtracker')
+from _aws import TARGET_RCU, batch_delete_keys, get_session, get_table, rate_limited_pages
+
+# Shared, cached AWS handles
+session = get_session()
+table = get_table()
+
+# Query the source-index GSI so only Slack rows are read; linked Slack rows
+# are re-keyed to ZD-* and must survive, so keep only SL-*
+SLACK_QUERY = {
+    'IndexName': 'source-index',
+    'KeyConditionExpression': Key('sourceSystem').eq('slack'),
+    'FilterExpression': Attr('PK').begins_with('SL-')
+}
+
+def _preview(text, limit=100):
+    """Truncate text for a sample preview, marking cut text with an ellipsis."""
+    return text[:limit] + '...' if len(text) > limit else text
 
 def scan_slack_records():
-    """Scan for all Slack records in the table."""
+    """Collect the (PK, SK) keys of all Slack records."""
     print("Scanning for Slack records...")
     
-    response = table.scan(
-        FilterExpression='source_system = :source',
-        ExpressionAttributeValues={':source': 'slack'}
-    )
-    
-    items = response.get('Items', [])
+    # Only the keys are needed to delete, so leave text and subject on the server
+    keys = []
+    for response in rate_limited_pages(
+        table.query, TARGET_RCU,
+        ProjectionExpression='PK, SK', Select='SPECIFIC_ATTRIBUTES', **SLACK_QUERY
+    ):
+        keys.extend((item['PK'], item['SK']) for item in response.get('Items', []))
     
-    # Handle pagination
-    while 'LastEvaluatedKey' in response:
-        response = table.scan(
-            FilterExpression='source_system = :source',
-            ExpressionAttributeValues={':source': 'slack'},
-            ExclusiveStartKey=response['LastEvaluatedKey']
-        )
-        items.extend(response.get('Items', []))
-    
-    print(f"Found {len(items)} Slack records total")
-    return items
+    print(f"Found {len(keys)} Slack records total")
+    return keys
+
+def get_sample_records(limit=3):
+    """Fetch a few Slack records with their text for the review preview."""
+    response = table.query(
+        ProjectionExpression='PK, SK, subject, #t',
+        ExpressionAttributeNames={'#t': 'text'},
+        Limit=limit,
+        **SLACK_QUERY
+    )
+    return response.get('Items', [])
 
-def delete_records_batch(records_to_delete):
-    """Delete records in batches."""
-    if not records_to_delete:
+def delete_records_batch(keys_to_delete):
+    """Delete (PK, SK) keys with concurrent batch writes."""
+    if not keys_to_delete:
         print("No records to delete.")
         return
     
-    print(f"\nDeleting {len(records_to_delete)} records...")
+    print(f"\nDeleting {len(keys_to_delete)} records...")
     
-    # Delete in batches of 25 (DynamoDB limit)
-    batch_size = 25
     deleted_count = 0
     
-    for i in range(0, len(records_to_delete), batch_size):
-        batch = records_to_delete[i:i + batch_size]
-        
-        with table.batch_writer() as batch_writer:
-            for record in batch:
-                try:
-                    batch_writer.delete_item(
-                        Key={
-                            'PK': record['PK'],
-                            'SK': record['SK']
-                        }
-                    )
-                    deleted_count += 1
-                except Exception as e:
-                    print(f"Error deleting record {record.get('PK', 'unknown')}: {e}")
-        
-        print(f"Deleted batch {i//batch_size + 1}: {len(batch)} records")
-        time.sleep(0.1)  # Small delay to avoid throttling
+    # Concurrent 25-key BatchWriteItem calls, unprocessed items are resent
+    for deleted_count in batch_delete_keys(table, keys_to_delete):
+        if deleted_count % 100 == 0:
+            print(f"Deleted {deleted_count}/{len(keys_to_delete)} records")
     
     print(f"\nSuccessfully deleted {deleted_count} records")
 
@@ -77,17 +76,20 @@ def trigger_fresh_ingestion():
     lambda_client = session.client('lambda', region_name='us-west-2')
     
     try:
+        # Fire and forget: Lambda queues the run and answers 202 right away
         response = lambda_client.invoke(
             FunctionName='evt-bugtracker_bug-tracker-ingestion',
-            InvocationType='RequestResponse',
-            Payload=json.dumps({
+            InvocationType='Event',
+            Payload=orjson.dumps({
                 'source': 'slack',  # Only ingest Slack
                 'incremental': False  # Full refresh
             })
         )
         
-        result = json.loads(response['Payload'].read())
-        print(f"✅ Ingestion triggered successfully: {result}")
+        if response['StatusCode'] == 202:
+            print(f"✅ Ingestion triggered successfully")
+        else:
+            print(f"⚠️  Unexpected invoke status: {response['StatusCode']}")
         
     except Exception as e:
         print(f"❌ Error triggering ingestion: {e}")
@@ -97,31 +99,31 @@ def main():
     print("🧹 Starting COMPLETE Slack records cleanup...")
     print("This will delete ALL Slack records and re-ingest with proper AUTHOR filtering.\n")
     
-    # Step 1: Scan all Slack records
-    all_slack_records = scan_slack_records()
+    # Step 1: Scan all Slack record keys
+    all_slack_keys = scan_slack_records()
     
-    if not all_slack_records:
+    if not all_slack_keys:
         print("No Slack records found.")
         return
     
     # Step 2: Show sample for review
     print(f"\n📋 Sample records to be deleted:")
-    for i, record in enumerate(all_slack_records[:3]):
-        text_preview = record.get('text', '')[:100] + ('...' if len(record.get('text', '')) > 100 else '')
-        print(f"{i+1}. PK: {record.get('PK', 'N/A')}")
+    for i, record in enumerate(get_sample_records(), 1):
+        text_preview = _preview(record.get('text') or '')
+        print(f"{i}. PK: {record.get('PK', 'N/A')}")
         print(f"   Subject: {record.get('subject', 'N/A')}")
         print(f"   Text: {text_preview}")
         print()
     
     # Step 3: Confirm deletion
-    print(f"\n⚠️  About to delete ALL {len(all_slack_records)} Slack records")
+    print(f"\n⚠️  About to delete ALL {len(all_slack_keys)} Slack records")
     print("Then trigger fresh ingestion with AUTHOR filter")
     
     confirm = input("\nProceed with complete cleanup? (yes/no): ").strip().lower()
     
     if confirm == 'yes':
         # Delete all Slack records
-        delete_records_batch(all_slack_records)
+        delete_records_batch(all_slack_keys)
         
         # Wait a moment
         print("\nWaiting 3 seconds before re-ingestion...")
@@ -4,97 +4,89 @@ Script to clean up Slack records in DynamoDB that don't contain "AUTHOR" in thei
 This removes noise from general chat messages that aren't actual bug reports.
 """
 
-import boto3
 import json
 from decimal import Decimal
-import time
+from boto3.dynamodb.conditions import Attr, Key
 
-# Configure AWS session
-session = boto3.Session(profile_name='AdministratorAccess12hr-100142810612')
-dynamodb = session.resource('dynamodb', region_name='us-west-2')
-table = dynamodb.Table('BugTracker-evt-bugtracker')
+from _aws import TARGET_RCU, batch_delete_keys, get_table, rate_limited_pages
+from _slack_filter import AUTHOR_RE
 
-def scan_slack_records():
-    """Scan for all Slack records in the table."""
+# Shared, cached AWS handles
+table = get_table()
+
+# Filter conditions built once and reused by every scan and query below
+_SL_FILTER = Attr('PK').begins_with('SL-')
+
+def _preview(text, limit=100):
+    """Truncate text for a sample preview, marking cut text with an ellipsis."""
+    return text[:limit] + '...' if len(text) > limit else text
+
+def iter_slack_records():
+    """Yield Slack records page by page without collecting them."""
     print("Scanning for Slack records...")
     
-    response = table.scan(
-        FilterExpression='source_system = :source',
-        ExpressionAttributeValues={':source': 'slack'}
-    )
-    
-    items = response.get('Items', [])
-    
-    # Handle pagination
-    while 'LastEvaluatedKey' in response:
-        response = table.scan(
-            FilterExpression='source_system = :source',
-            ExpressionAttributeValues={':source': 'slack'},
-            ExclusiveStartKey=response['LastEvaluatedKey']
-        )
-        items.extend(response.get('Items', []))
-    
-    print(f"Found {len(items)} Slack records total")
-    return items
+    # Query the source-index GSI so only Slack rows are read, and only
+    # fetch the attributes used for the preview and the delete keys; linked
+    # Slack rows are re-keyed to ZD-*, so keep only SL-*
+    query_kwargs = {
+        'IndexName': 'source-index',
+        'KeyConditionExpression': Key('sourceSystem').eq('slack'),
+        'FilterExpression': _SL_FILTER,
+        'ProjectionExpression': 'PK, SK, subject, #t, channel',
+        'ExpressionAttributeNames': {'#t': 'text'}
+    }
+    
+    for response in rate_limited_pages(table.query, TARGET_RCU, **query_kwargs):
+        yield from response.get('Items', [])
 
-def filter_records_without_author(records):
-    """Filter records that don't contain 'AUTHOR' in their text."""
-    records_to_delete = []
-    records_to_keep = []
+def classify_records(records, sample_limit=3):
+    """Collect delete keys for records without 'AUTHOR', keeping a few samples of each kind."""
+    keys_to_delete = []
+    kept_count = 0
+    delete_samples = []
+    keep_samples = []
     
     for record in records:
-        text = record.get('text', '')
-        if 'AUTHOR' not in text.upper():
-            records_to_delete.append(record)
+        if AUTHOR_RE.search(record.get('text') or '') is None:
+            keys_to_delete.append((record['PK'], record['SK']))
+            if len(delete_samples) < sample_limit:
+                delete_samples.append(record)
         else:
-            records_to_keep.append(record)
+            kept_count += 1
+            if len(keep_samples) < sample_limit:
+                keep_samples.append(record)
     
-    print(f"Records to delete (no AUTHOR): {len(records_to_delete)}")
-    print(f"Records to keep (has AUTHOR): {len(records_to_keep)}")
+    print(f"Found {len(keys_to_delete) + kept_count} Slack records total")
+    print(f"Records to delete (no AUTHOR): {len(keys_to_delete)}")
+    print(f"Records to keep (has AUTHOR): {kept_count}")
     
-    return records_to_delete, records_to_keep
+    return keys_to_delete, kept_count, delete_samples, keep_samples
 
-def show_sample_records(records, title, limit=3):
-    """Show sample records for review."""
+def show_sample_records(records, title):
+    """Show already-collected sample records for review."""
     print(f"\n=== {title} ===")
-    for i, record in enumerate(records[:limit]):
-        text_preview = record.get('text', '')[:100] + ('...' if len(record.get('text', '')) > 100 else '')
-        print(f"{i+1}. PK: {record.get('PK', 'N/A')}")
+    for i, record in enumerate(records, 1):
+        text_preview = _preview(record.get('text') or '')
+        print(f"{i}. PK: {record.get('PK', 'N/A')}")
         print(f"   Subject: {record.get('subject', 'N/A')}")
         print(f"   Text: {text_preview}")
         print(f"   Channel: {record.get('channel', 'N/A')}")
         print()
 
-def delete_records_batch(records_to_delete):
-    """Delete records in batches."""
-    if not records_to_delete:
+def delete_records_batch(keys_to_delete):
+    """Delete (PK, SK) keys with concurrent batch writes."""
+    if not keys_to_delete:
         print("No records to delete.")
         return
     
-    print(f"\nDeleting {len(records_to_delete)} records...")
+    print(f"\nDeleting {len(keys_to_delete)} records...")
     
-    # Delete in batches of 25 (DynamoDB limit)
-    batch_size = 25
     deleted_count = 0
     
-    for i in range(0, len(records_to_delete), batch_size):
-        batch = records_to_delete[i:i + batch_size]
-        
-        with table.batch_writer() as batch_writer:
-            for record in batch:
-                try:
-                    batch_writer.delete_item(
-                        Key={
-                            'PK': record['PK'],
-                            'SK': record['SK']
-                        }
-                    )
-                    deleted_count += 1
-                except Exception as e:
-                    print(f"Error deleting record {record.get('PK', 'unknown')}: {e}")
-        
-        print(f"Deleted batch {i//batch_size + 1}: {len(batch)} records")
-        time.sleep(0.1)  # Small delay to avoid throttling
+    # Concurrent 25-key BatchWriteItem calls, unprocessed items are resent
+    for deleted_count in batch_delete_keys(table, keys_to_delete):
+        if deleted_count % 100 == 0:
+            print(f"Deleted {deleted_count}/{len(keys_to_delete)} records")
     
     print(f"\nSuccessfully deleted {deleted_count} records")
 
@@ -103,29 +95,26 @@ def main():
     print("🧹 Starting Slack records cleanup...")
     print("This will delete Slack records that don't contain 'AUTHOR' in their text content.\n")
     
-    # Step 1: Scan all Slack records
-    all_slack_records = scan_slack_records()
+    # Step 1: Stream Slack records, keeping only delete keys and samples
+    keys_to_delete, kept_count, delete_samples, keep_samples = classify_records(iter_slack_records())
     
-    if not all_slack_records:
+    if not keys_to_delete and not kept_count:
         print("No Slack records found.")
         return
     
-    # Step 2: Filter records
-    records_to_delete, records_to_keep = filter_records_without_author(all_slack_records)
-    
-    # Step 3: Show samples for review
-    show_sample_records(records_to_delete, "SAMPLE RECORDS TO DELETE (no AUTHOR)")
-    show_sample_records(records_to_keep, "SAMPLE RECORDS TO KEEP (has AUTHOR)")
+    # Step 2: Show samples for review
+    show_sample_records(delete_samples, "SAMPLE RECORDS TO DELETE (no AUTHOR)")
+    show_sample_records(keep_samples, "SAMPLE RECORDS TO KEEP (has AUTHOR)")
     
-    # Step 4: Confirm deletion
-    if records_to_delete:
-        print(f"\n⚠️  About to delete {len(records_to_delete)} Slack records that don't contain 'AUTHOR'")
-        print(f"✅ Will keep {len(records_to_keep)} Slack records that contain 'AUTHOR'")
+    # Step 3: Confirm deletion
+    if keys_to_delete:
+        print(f"\n⚠️  About to delete {len(keys_to_delete)} Slack records that don't contain 'AUTHOR'")
+        print(f"✅ Will keep {kept_count} Slack records that contain 'AUTHOR'")
         
         confirm = input("\nProceed with deletion? (yes/no): ").strip().lower()
         
         if confirm == 'yes':
-            delete_records_batch(records_to_delete)
+            delete_records_batch(keys_to_delete)
             print("\n✅ Cleanup completed successfully!")
         else:
             print("❌ Deletion cancelled.")
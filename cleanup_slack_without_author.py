@@ -4,129 +4,132 @@ Targeted cleanup script to delete Slack records that don't contain "AUTHOR" in t
 This will keep legitimate bug reports and remove noise from general chat messages.
 """
 
-import boto3
 import json
-import time
+from boto3.dynamodb.conditions import Attr, Key
 
-# Configure AWS session
-session = boto3.Session(profile_name='AdministratorAccess12hr-100142810612')
-dynamodb = session.resource('dynamodb', region_name='us-west-2')
-table = dynamodb.Table('BugTracker-evt-bugtracker')
+from _aws import TARGET_RCU, batch_delete_keys, get_table, rate_limited_pages
+from _slack_filter import AUTHOR_RE
 
-def get_all_records():
-    """Get all records from the table."""
-    print("Scanning all records in BugTracker-evt-bugtracker...")
-    
-    all_items = []
-    response = table.scan()
-    all_items.extend(response.get('Items', []))
-    
-    # Handle pagination
-    while 'LastEvaluatedKey' in response:
-        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-        all_items.extend(response.get('Items', []))
-    
-    print(f"Found {len(all_items)} total records")
-    return all_items
+# Shared, cached AWS handles
+table = get_table()
+
+def _preview(text, limit=100):
+    """Truncate text for a sample preview, marking cut text with an ellipsis."""
+    return text[:limit] + '...' if len(text) > limit else text
 
-def filter_slack_without_author(records):
-    """Filter Slack records that don't contain 'AUTHOR' in their text."""
-    slack_records_to_delete = []
-    slack_records_to_keep = []
-    non_slack_records = []
+def iter_slack_records():
+    """Yield Slack records from the source-index GSI page by page."""
+    print("Querying Slack records in BugTracker-evt-bugtracker...")
+    
+    # Linked Slack rows are re-keyed to ZD-*, so keep only SL-* rows
+    query_kwargs = {
+        'IndexName': 'source-index',
+        'KeyConditionExpression': Key('sourceSystem').eq('slack'),
+        'FilterExpression': Attr('PK').begins_with('SL-'),
+        'ProjectionExpression': 'PK, SK, #t',
+        'ExpressionAttributeNames': {'#t': 'text'}
+    }
+    
+    for response in rate_limited_pages(table.query, TARGET_RCU, **query_kwargs):
+        yield from response.get('Items', [])
+
+def filter_slack_without_author(records, sample_limit=3):
+    """Classify Slack records in one pass, keeping delete keys and a few samples of each kind."""
+    keys_to_delete = []
+    kept_count = 0
+    delete_samples = []
+    keep_samples = []
     
     for record in records:
-        # Check if it's a Slack record (PK starts with 'SL-')
-        pk = record.get('PK', '')
-        if pk.startswith('SL-'):
-            text = record.get('text', '')
-            # Check if 'AUTHOR' is in the text (case insensitive)
-            if 'AUTHOR' in text.upper():
-                slack_records_to_keep.append(record)
-            else:
-                slack_records_to_delete.append(record)
+        # Check if 'AUTHOR' is in the text (case insensitive)
+        if AUTHOR_RE.search(record.get('text') or ''):
+            kept_count += 1
+            if len(keep_samples) < sample_limit:
+                keep_samples.append(record)
         else:
-            non_slack_records.append(record)
+            keys_to_delete.append((record['PK'], record['SK']))
+            if len(delete_samples) < sample_limit:
+                delete_samples.append(record)
     
     print(f"\n📊 Record Analysis:")
-    print(f"- Slack records WITHOUT 'AUTHOR' (to delete): {len(slack_records_to_delete)}")
-    print(f"- Slack records WITH 'AUTHOR' (to keep): {len(slack_records_to_keep)}")
-    print(f"- Non-Slack records (untouched): {len(non_slack_records)}")
+    print(f"- Slack records WITHOUT 'AUTHOR' (to delete): {len(keys_to_delete)}")
+    print(f"- Slack records WITH 'AUTHOR' (to keep): {kept_count}")
     
-    return slack_records_to_delete, slack_records_to_keep
+    return keys_to_delete, kept_count, delete_samples, keep_samples
 
-def show_sample_records(records, title, limit=3):
-    """Show sample records for review."""
+def show_sample_records(records, title):
+    """Show already-collected sample records for review."""
     print(f"\n=== {title} ===")
-    for i, record in enumerate(records[:limit]):
-        text_preview = record.get('text', '')[:100] + ('...' if len(record.get('text', '')) > 100 else '')
-        print(f"{i+1}. PK: {record.get('PK', 'N/A')}")
+    for i, record in enumerate(records, 1):
+        text_preview = _preview(record.get('text') or '')
+        print(f"{i}. PK: {record.get('PK', 'N/A')}")
         print(f"   Text: {text_preview}")
-        print(f"   Has AUTHOR: {'YES' if 'AUTHOR' in record.get('text', '').upper() else 'NO'}")
+        print(f"   Has AUTHOR: {'YES' if AUTHOR_RE.search(record.get('text') or '') else 'NO'}")
         print()
 
-def delete_records_batch(records_to_delete):
-    """Delete records in batches."""
-    if not records_to_delete:
+def delete_records_batch(keys_to_delete):
+    """Delete (PK, SK) keys with concurrent batch writes."""
+    if not keys_to_delete:
         print("No records to delete.")
         return
     
-    print(f"\nDeleting {len(records_to_delete)} Slack records without 'AUTHOR'...")
+    print(f"\nDeleting {len(keys_to_delete)} Slack records without 'AUTHOR'...")
     
-    # Delete in batches of 25 (DynamoDB limit)
-    batch_size = 25
     deleted_count = 0
     
-    for i in range(0, len(records_to_delete), batch_size):
-        batch = records_to_delete[i:i + batch_size]
-        
-        with table.batch_writer() as batch_writer:
-            for record in batch:
-                try:
-                    batch_writer.delete_item(
-                        Key={
-                            'PK': record['PK'],
-                            'SK': record['SK']
-                        }
-                    )
-                    deleted_count += 1
-                except Exception as e:
-                    print(f"Error deleting record {record.get('PK', 'unknown')}: {e}")
-        
-        print(f"Deleted batch {i//batch_size + 1}/{(len(records_to_delete) + batch_size - 1) // batch_size}: {len(batch)} records")
-        time.sleep(0.2)  # Small delay to avoid throttling
+    # Concurrent 25-key BatchWriteItem calls, unprocessed items are resent
+    for deleted_count in batch_delete_keys(table, keys_to_delete):
+        if deleted_count % 100 == 0:
+            print(f"Deleted {deleted_count}/{len(keys_to_delete)} records")
     
     print(f"\n✅ Successfully deleted {deleted_count} Slack records without 'AUTHOR'")
 
+def count_records():
+    """Count all records server-side without downloading them."""
+    total = 0
+    scan_kwargs = {'Select': 'COUNT'}
+    
+    while True:
+        response = table.scan(**scan_kwargs)
+        total += response.get('Count', 0)
+        
+        if 'LastEvaluatedKey' not in response:
+            return total
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+def count_slack_records(has_author):
+    """Count SL-* records with or without AUTHOR using COUNT queries on the source-index GSI."""
+    author_filter = Attr('text').contains('AUTHOR') | Attr('text').contains('author')
+    if not has_author:
+        author_filter = ~author_filter
+    
+    total = 0
+    query_kwargs = {
+        'IndexName': 'source-index',
+        'KeyConditionExpression': Key('sourceSystem').eq('slack'),
+        'FilterExpression': Attr('PK').begins_with('SL-') & author_filter,
+        'Select': 'COUNT'
+    }
+    
+    while True:
+        response = table.query(**query_kwargs)
+        total += response.get('Count', 0)
+        
+        if 'LastEvaluatedKey' not in response:
+            return total
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
 def verify_results():
     """Verify the cleanup results."""
     print("\n🔍 Verifying results...")
     
     # Count remaining records
-    response = table.scan(Select='COUNT')
-    total_count = response.get('Count', 0)
+    total_count = count_records()
     print(f"Total records remaining: {total_count}")
     
     # Count remaining Slack records
-    all_items = []
-    response = table.scan()
-    all_items.extend(response.get('Items', []))
-    
-    while 'LastEvaluatedKey' in response:
-        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-        all_items.extend(response.get('Items', []))
-    
-    slack_with_author = 0
-    slack_without_author = 0
-    
-    for record in all_items:
-        pk = record.get('PK', '')
-        if pk.startswith('SL-'):
-            text = record.get('text', '')
-            if 'AUTHOR' in text.upper():
-                slack_with_author += 1
-            else:
-                slack_without_author += 1
+    slack_with_author = count_slack_records(has_author=True)
+    slack_without_author = count_slack_records(has_author=False)
     
     print(f"Remaining Slack records WITH 'AUTHOR': {slack_with_author}")
     print(f"Remaining Slack records WITHOUT 'AUTHOR': {slack_without_author}")
@@ -143,28 +146,25 @@ def main():
     print("This will delete Slack records that don't contain 'AUTHOR' in their text content.")
     print("This keeps legitimate bug reports and removes general chat noise.\n")
     
-    # Step 1: Get all records
-    all_records = get_all_records()
+    # Step 1: Read and classify Slack records in a single pass
+    slack_to_delete, kept_count, delete_samples, keep_samples = filter_slack_without_author(iter_slack_records())
     
-    if not all_records:
-        print("No records found in table.")
+    if not slack_to_delete and not kept_count:
+        print("No Slack records found in table.")
         return
     
-    # Step 2: Filter Slack records
-    slack_to_delete, slack_to_keep = filter_slack_without_author(all_records)
-    
-    # Step 3: Show samples
-    if slack_to_delete:
-        show_sample_records(slack_to_delete, "SLACK RECORDS TO DELETE (no AUTHOR)")
+    # Step 2: Show samples
+    if delete_samples:
+        show_sample_records(delete_samples, "SLACK RECORDS TO DELETE (no AUTHOR)")
     
-    if slack_to_keep:
-        show_sample_records(slack_to_keep, "SLACK RECORDS TO KEEP (has AUTHOR)")
+    if keep_samples:
+        show_sample_records(keep_samples, "SLACK RECORDS TO KEEP (has AUTHOR)")
     
-    # Step 4: Confirm deletion
+    # Step 3: Confirm deletion
     if slack_to_delete:
         print(f"\n⚠️  About to delete {len(slack_to_delete)} Slack records without 'AUTHOR'")
-        print(f"✅ Will keep {len(slack_to_keep)} Slack records with 'AUTHOR'")
-        print(f"✅ Will keep all {len(all_records) - len(slack_to_delete) - len(slack_to_keep)} non-Slack records")
+        print(f"✅ Will keep {kept_count} Slack records with 'AUTHOR'")
+        print("✅ Will keep all non-Slack records")
         
         confirm = input("\nProceed with Slack cleanup? (yes/no): ").strip().lower()
         
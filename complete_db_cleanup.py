@@ -4,61 +4,43 @@ Complete database cleanup script.
 This will delete ALL records from BugTracker-evt-bugtracker and trigger fresh ingestion.
 """
 
-import boto3
-import json
+import orjson
 import time
 
-# Configure AWS session
-session = boto3.Session(profile_name='AdministratorAccess12hr-100142810612')
-dynamodb = session.resource('dynamodb', region_name='us-west-2')
-table = dynamodb.Table('BugTracker-evt-bugtracker')
+from _aws import (
+    MAX_DELETE_WORKERS,
+    batch_delete_keys, get_session, get_table, parallel_scan_pages, rate_limited_pages
+)
 
-def get_all_records():
-    """Get all records from the table."""
-    print("Scanning all records in BugTracker-evt-bugtracker...")
-    
-    all_items = []
-    response = table.scan()
-    all_items.extend(response.get('Items', []))
-    
-    # Handle pagination
-    while 'LastEvaluatedKey' in response:
-        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-        all_items.extend(response.get('Items', []))
-    
-    print(f"Found {len(all_items)} total records")
-    return all_items
+# Shared, cached AWS handles (adaptive retries handle throttling)
+session = get_session()
+table = get_table()
 
-def delete_all_records(records):
-    """Delete all records in batches."""
-    if not records:
-        print("No records to delete.")
-        return
-    
-    print(f"\nDeleting {len(records)} records...")
+def iter_keys():
+    """Yield (PK, SK) for every record from a keys-only parallel scan."""
+    for response in parallel_scan_pages(table, ProjectionExpression='PK, SK', Select='SPECIFIC_ATTRIBUTES'):
+        for item in response.get('Items', []):
+            yield item['PK'], item['SK']
+
+def get_sample_records(limit=3):
+    """Fetch a few records for the review preview."""
+    response = table.scan(
+        ProjectionExpression='PK, SK, source_system',
+        Limit=limit
+    )
+    return response.get('Items', [])
+
+def delete_all_records(keys):
+    """Delete (PK, SK) keys as they stream in, with concurrent batch writes."""
+    print("\nDeleting all records...")
     
-    # Delete in batches of 25 (DynamoDB limit)
-    batch_size = 25
     deleted_count = 0
     
-    for i in range(0, len(records), batch_size):
-        batch = records[i:i + batch_size]
-        
-        with table.batch_writer() as batch_writer:
-            for record in batch:
-                try:
-                    batch_writer.delete_item(
-                        Key={
-                            'PK': record['PK'],
-                            'SK': record['SK']
-                        }
-                    )
-                    deleted_count += 1
-                except Exception as e:
-                    print(f"Error deleting record {record.get('PK', 'unknown')}: {e}")
-        
-        print(f"Deleted batch {i//batch_size + 1}/{(len(records) + batch_size - 1) // batch_size}: {len(batch)} records")
-        time.sleep(0.1)  # Small delay to avoid throttling
+    # The whole table goes, so run the full pool of concurrent BatchWriteItem
+    # calls; the table's item count is too stale to size it by
+    for deleted_count in batch_delete_keys(table, keys, max_workers=MAX_DELETE_WORKERS):
+        if deleted_count % 100 == 0:
+            print(f"Deleted {deleted_count} records")
     
     print(f"\n✅ Successfully deleted {deleted_count} records")
 
@@ -75,15 +57,17 @@ def trigger_complete_ingestion():
             'cleanup_stale': True  # Clean up stale records
         }
         
+        # Fire and forget: Lambda queues the run and answers 202 right away
         response = lambda_client.invoke(
             FunctionName='evt-bugtracker_bug-tracker-ingestion',
-            InvocationType='RequestResponse',
-            Payload=json.dumps(payload)
+            InvocationType='Event',
+            Payload=orjson.dumps(payload)
         )
         
-        result = json.loads(response['Payload'].read())
-        print(f"✅ Complete ingestion triggered successfully")
-        print(f"Response: {result}")
+        if response['StatusCode'] == 202:
+            print(f"✅ Complete ingestion triggered successfully")
+        else:
+            print(f"⚠️  Unexpected invoke status: {response['StatusCode']}")
         
     except Exception as e:
         print(f"❌ Error triggering ingestion: {e}")
@@ -92,15 +76,19 @@ def verify_cleanup():
     """Verify the cleanup was successful."""
     print("\nVerifying cleanup...")
     
-    response = table.scan(Select='COUNT')
-    count = response.get('Count', 0)
+    # Existence probe: one key is enough to tell, no need to count the table.
+    # A page can come back empty with a LastEvaluatedKey, so keep paging until
+    # a key turns up or the scan ends.
+    remaining = None
+    for page in rate_limited_pages(table.scan, Limit=1, ProjectionExpression='PK'):
+        if page.get('Items'):
+            remaining = page['Items'][0]['PK']
+            break
     
-    print(f"Records remaining in table: {count}")
-    
-    if count == 0:
+    if remaining is None:
         print("✅ Database completely cleaned!")
     else:
-        print(f"⚠️  {count} records still remain")
+        print(f"⚠️  Records still remain (e.g. {remaining})")
 
 def main():
     """Main cleanup process."""
@@ -112,30 +100,35 @@ def main():
     print("3. Fix the slow dashboard loading issue")
     print()
     
-    # Step 1: Get all records
-    all_records = get_all_records()
+    # Step 1: Preview a few records; keys are only scanned once deletion starts
+    samples = get_sample_records()
     
-    if not all_records:
+    if not samples:
         print("No records found in table.")
         return
     
+    # DescribeTable's item count is refreshed only about every six hours, so it
+    # can be 0 or far off right after an ingestion; it is shown as an estimate only
+    estimated_count = table.item_count
+    
     # Show sample records
     print("\n📋 Sample records to be deleted:")
-    for i, record in enumerate(all_records[:3]):
-        print(f"{i+1}. PK: {record.get('PK', 'N/A')}")
+    for i, record in enumerate(samples, 1):
+        print(f"{i}. PK: {record.get('PK', 'N/A')}")
         print(f"   SK: {record.get('SK', 'N/A')}")
         print(f"   source_system: {record.get('source_system', 'null')}")
         print()
     
     # Confirm deletion
-    print(f"⚠️  About to delete ALL {len(all_records)} records")
+    print("⚠️  About to delete ALL records in the table")
+    print(f"   Estimated count: {estimated_count} (DynamoDB refreshes this about every 6 hours, so it may be stale or 0)")
     print("This will completely clean the database and start fresh")
     
     confirm = input("\nProceed with COMPLETE cleanup? (type 'DELETE ALL' to confirm): ").strip()
     
     if confirm == 'DELETE ALL':
-        # Delete all records
-        delete_all_records(all_records)
+        # Delete all records while they are scanned
+        delete_all_records(iter_keys())
         
         # Verify cleanup
         verify_cleanup()
@@ -4,95 +4,37 @@ Comprehensive Slack cleanup - remove all Slack records that are not proper bug r
 Keep only records with "AUTHOR" or proper bug report structure.
 """
 
-import boto3
-import time
+from boto3.dynamodb.conditions import Attr, Key
 
-# Configure AWS session
-session = boto3.Session(profile_name='AdministratorAccess12hr-100142810612')
-dynamodb = session.resource('dynamodb', region_name='us-west-2')
-table = dynamodb.Table('BugTracker-evt-bugtracker')
+from _aws import get_table
+from _slack_filter import is_valid_bug_report
+from slack_cleanup import scan_and_delete
 
-def is_valid_bug_report(text):
-    """Check if a Slack message is a valid bug report."""
-    text_upper = text.upper()
-    
-    # Keep messages that contain "AUTHOR" (main bug report format)
-    if 'AUTHOR' in text_upper:
-        return True
-    
-    # These appear to be incomplete templates, not actual bug reports
-    template_indicators = [
-        '*CASTING COMPANY*',
-        '*AFFECTED USER*',
-        'ALESSI HARTIGAN',
-        'GENERAL / NO SPECIFIC CLIENT'
-    ]
-    
-    # If it contains template indicators but no actual content, it's likely not a real bug report
-    for indicator in template_indicators:
-        if indicator in text_upper:
-            # Check if it's just a template without real bug details
-            if ('*USER\'S INFO (NAME / CONTACT' in text_upper or 
-                '*USER\'S INFO (NAME / CO...' in text_upper):
-                return False
-    
-    # Keep messages that might be legitimate bug reports with different formats
-    # You can add more criteria here if needed
-    return False
+# Shared, cached AWS handles (adaptive retries handle throttling)
+table = get_table()
+
+# Filter conditions built once and reused by every scan and query below
+_SL_FILTER = Attr('PK').begins_with('SL-')
+# contains() is case-sensitive, so cover both spellings seen in Slack
+_HAS_AUTHOR = Attr('text').contains('AUTHOR') | Attr('text').contains('author')
 
 def scan_and_delete_invalid_slack():
     """Scan and delete invalid Slack records."""
     print("🧹 Starting comprehensive Slack cleanup...")
     print("Scanning for invalid Slack records...")
     
-    deleted_count = 0
-    kept_count = 0
-    total_scanned = 0
-    batch_items = []
-    
-    # Scan the table in chunks
-    paginator = table.scan()
-    
-    while True:
-        try:
-            # Process current page
-            items = paginator.get('Items', [])
-            total_scanned += len(items)
-            
-            for item in items:
-                pk = item.get('PK', '')
-                
-                # Check if it's a Slack record
-                if pk.startswith('SL-'):
-                    text = item.get('text', '')
-                    
-                    if is_valid_bug_report(text):
-                        kept_count += 1
-                    else:
-                        batch_items.append(item)
-                        
-                        # Delete in batches of 25
-                        if len(batch_items) >= 25:
-                            delete_batch(batch_items)
-                            deleted_count += len(batch_items)
-                            batch_items = []
-                            print(f"Deleted {deleted_count} invalid Slack records...")
-            
-            # Check if there are more pages
-            if 'LastEvaluatedKey' not in paginator:
-                break
-                
-            # Get next page
-            paginator = table.scan(ExclusiveStartKey=paginator['LastEvaluatedKey'])
-            
-        except Exception as e:
-            print(f"Error during scan: {e}")
-            break
+    # Records with AUTHOR are always valid, so DynamoDB drops them before they
+    # are sent; only deletion candidates come back, with the text for a final
+    # check that catches spellings contains() misses, such as 'Author'
+    deleted_count, kept_count, total_scanned = scan_and_delete(
+        lambda item: not is_valid_bug_report(item.get('text', '')),
+        filter_expression=_SL_FILTER & ~_HAS_AUTHOR,
+        projection='PK, SK, #t',
+        label="invalid Slack records"
+    )
     
-    # Delete remaining items in batch
-    if batch_items:
-        delete_batch(batch_items)
-        deleted_count += len(batch_items)
+    # The AUTHOR records filtered out server-side are kept too
+    kept_count += count_slack_with_author()
     
     print(f"\n✅ Comprehensive cleanup completed!")
     print(f"- Total records scanned: {total_scanned}")
@@ -101,20 +43,23 @@ def scan_and_delete_invalid_slack():
     
     return deleted_count
 
-def delete_batch(items):
-    """Delete a batch of items."""
-    try:
-        with table.batch_writer() as batch:
-            for item in items:
-                batch.delete_item(
-                    Key={
-                        'PK': item['PK'],
-                        'SK': item['SK']
-                    }
-                )
-        time.sleep(0.1)  # Small delay to avoid throttling
-    except Exception as e:
-        print(f"Error deleting batch: {e}")
+def count_slack_with_author():
+    """Count SL-* records with AUTHOR, reading only Slack rows through the source-index GSI."""
+    total = 0
+    query_kwargs = {
+        'IndexName': 'source-index',
+        'KeyConditionExpression': Key('sourceSystem').eq('slack'),
+        'FilterExpression': _SL_FILTER & _HAS_AUTHOR,
+        'Select': 'COUNT'
+    }
+    
+    while True:
+        response = table.query(**query_kwargs)
+        total += response.get('Count', 0)
+        
+        if 'LastEvaluatedKey' not in response:
+            return total
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
 
 def verify_results():
     """Quick verification of results."""
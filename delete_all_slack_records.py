@@ -4,102 +4,52 @@ Delete ALL Slack records regardless of content.
 This is the most comprehensive solution to prevent Slack noise in the dashboard.
 """
 
-import boto3
-import time
+from boto3.dynamodb.conditions import Attr
 
-# Configure AWS session
-session = boto3.Session(profile_name='AdministratorAccess12hr-100142810612')
-dynamodb = session.resource('dynamodb', region_name='us-west-2')
-table = dynamodb.Table('BugTracker-evt-bugtracker')
+from _aws import get_table, rate_limited_pages
+from slack_cleanup import scan_and_delete
+
+# Shared, cached AWS handles (adaptive retries handle throttling)
+table = get_table()
+
+# Filter conditions built once and reused by every scan and query below
+_SL_FILTER = Attr('PK').begins_with('SL-')
 
 def scan_and_delete_all_slack():
     """Delete ALL Slack records regardless of content."""
     print("🧹 Starting deletion of ALL Slack records...")
     print("This will remove ALL Slack messages regardless of content")
     
-    deleted_count = 0
-    total_slack = 0
-    batch_items = []
-    
-    # Scan the table in chunks
-    paginator = table.scan()
-    
-    while True:
-        try:
-            # Process current page
-            items = paginator.get('Items', [])
-            
-            for item in items:
-                pk = item.get('PK', '')
-                
-                # Check if it's a Slack record (PK starts with 'SL-')
-                if pk.startswith('SL-'):
-                    total_slack += 1
-                    batch_items.append(item)
-                    
-                    # Delete in batches of 25
-                    if len(batch_items) >= 25:
-                        delete_batch(batch_items)
-                        deleted_count += len(batch_items)
-                        batch_items = []
-                        if deleted_count % 100 == 0:
-                            print(f"Deleted {deleted_count} Slack records...")
-            
-            # Check if there are more pages
-            if 'LastEvaluatedKey' not in paginator:
-                break
-                
-            # Get next page
-            paginator = table.scan(ExclusiveStartKey=paginator['LastEvaluatedKey'])
-            
-        except Exception as e:
-            print(f"Error during scan: {e}")
-            break
-    
-    # Delete remaining items in batch
-    if batch_items:
-        delete_batch(batch_items)
-        deleted_count += len(batch_items)
+    # Query the source-index GSI so only Slack rows are read instead of the
+    # whole table; linked Slack rows are re-keyed to ZD-*, so keep only SL-*
+    deleted_count, _, _ = scan_and_delete(
+        filter_expression=_SL_FILTER,
+        slack_index=True,
+        label="Slack records"
+    )
     
     print(f"\n✅ Deletion of ALL Slack records completed!")
-    print(f"- Total Slack records found: {total_slack}")
     print(f"- Slack records deleted: {deleted_count}")
     
     return deleted_count
 
-def delete_batch(items):
-    """Delete a batch of items."""
-    try:
-        with table.batch_writer() as batch:
-            for item in items:
-                batch.delete_item(
-                    Key={
-                        'PK': item['PK'],
-                        'SK': item['SK']
-                    }
-                )
-        time.sleep(0.1)
-    except Exception as e:
-        print(f"Error deleting batch: {e}")
-
 def verify_no_slack_remaining():
     """Verify no Slack records remain."""
     print("\n🔍 Verifying no Slack records remain...")
     
     try:
-        response = table.scan(
-            FilterExpression='begins_with(PK, :pk)',
-            ExpressionAttributeValues={':pk': 'SL-'},
-            Select='COUNT'
-        )
-        
-        count = response.get('Count', 0)
-        print(f"Remaining Slack records: {count}")
+        # Existence probe: stop at the first Slack key instead of counting them all.
+        # Limit is applied before the filter, so keep paging until a match or the end.
+        remaining = None
+        for page in rate_limited_pages(table.scan, FilterExpression=_SL_FILTER, ProjectionExpression='PK'):
+            if page.get('Items'):
+                remaining = page['Items'][0]['PK']
+                break
         
-        if count == 0:
+        if remaining is None:
             print("✅ Perfect! No Slack records remaining.")
         else:
-            print(f"⚠️  Still {count} Slack records found.")
+            print(f"⚠️  Slack records still found (e.g. {remaining}).")
             
     except Exception as e:
         print(f"Error during verification: {e}")
@@ -114,6 +64,11 @@ def main():
     try:
         deleted_count = scan_and_delete_all_slack()
         
+        # Nothing matched, so there is nothing to verify or report
+        if deleted_count == 0:
+            print("\n✅ No Slack records found!")
+            return
+        
         verify_no_slack_remaining()
         
         print(f"\n📊 Expected dashboard results:")
@@ -4,91 +4,63 @@ Delete Slack records that contain 'AUTHOR' in their content.
 This will remove Slack messages that have the AUTHOR field but are still not legitimate bug reports.
 """
 
-import boto3
-import time
+from boto3.dynamodb.conditions import Attr, Key
 
-# Configure AWS session
-session = boto3.Session(profile_name='AdministratorAccess12hr-100142810612')
-dynamodb = session.resource('dynamodb', region_name='us-west-2')
-table = dynamodb.Table('BugTracker-evt-bugtracker')
+from _aws import get_table
+from _slack_filter import AUTHOR_RE
+from slack_cleanup import scan_and_delete
+
+# Shared, cached AWS handles (adaptive retries handle throttling)
+table = get_table()
+
+# Filter condition built once and reused by every scan and query below
+_SL_FILTER = Attr('PK').begins_with('SL-')
+
+def _preview(text, limit=100):
+    """Truncate text for a sample preview, marking cut text with an ellipsis."""
+    return text[:limit] + '...' if len(text) > limit else text
 
 def scan_and_delete_slack_with_author():
     """Delete Slack records that contain 'AUTHOR'."""
     print("🧹 Starting deletion of Slack records WITH 'AUTHOR'...")
     print("This will remove Slack messages that contain 'AUTHOR' field")
     
-    deleted_count = 0
-    kept_count = 0
-    total_slack = 0
-    batch_items = []
-    
-    # Scan the table in chunks
-    paginator = table.scan()
+    # contains() is case-sensitive and would miss spellings such as 'Author', so
+    # DynamoDB only narrows to Slack records and AUTHOR_RE makes the final call
+    deleted_count, _, _ = scan_and_delete(
+        lambda item: AUTHOR_RE.search(item.get('text', '')) is not None,
+        filter_expression=_SL_FILTER,
+        projection='PK, SK, #t',
+        label="Slack records with 'AUTHOR'"
+    )
     
-    while True:
-        try:
-            # Process current page
-            items = paginator.get('Items', [])
-            
-            for item in items:
-                pk = item.get('PK', '')
-                
-                # Check if it's a Slack record
-                if pk.startswith('SL-'):
-                    total_slack += 1
-                    text = item.get('text', '')
-                    
-                    # Delete if it contains 'AUTHOR'
-                    if 'AUTHOR' in text.upper():
-                        batch_items.append(item)
-                        
-                        # Delete in batches of 25
-                        if len(batch_items) >= 25:
-                            delete_batch(batch_items)
-                            deleted_count += len(batch_items)
-                            batch_items = []
-                            if deleted_count % 100 == 0:
-                                print(f"Deleted {deleted_count} Slack records with 'AUTHOR'...")
-                    else:
-                        kept_count += 1
-            
-            # Check if there are more pages
-            if 'LastEvaluatedKey' not in paginator:
-                break
-                
-            # Get next page
-            paginator = table.scan(ExclusiveStartKey=paginator['LastEvaluatedKey'])
-            
-        except Exception as e:
-            print(f"Error during scan: {e}")
-            break
-    
-    # Delete remaining items in batch
-    if batch_items:
-        delete_batch(batch_items)
-        deleted_count += len(batch_items)
+    # The kept records never leave DynamoDB, so count them on the source-index GSI
+    kept_count = count_remaining_slack()
     
     print(f"\n✅ Deletion of AUTHOR Slack records completed!")
-    print(f"- Total Slack records found: {total_slack}")
+    print(f"- Total Slack records found: {deleted_count + kept_count}")
     print(f"- Slack records deleted (had AUTHOR): {deleted_count}")
     print(f"- Slack records kept (no AUTHOR): {kept_count}")
     
     return deleted_count, kept_count
 
-def delete_batch(items):
-    """Delete a batch of items."""
-    try:
-        with table.batch_writer() as batch:
-            for item in items:
-                batch.delete_item(
-                    Key={
-                        'PK': item['PK'],
-                        'SK': item['SK']
-                    }
-                )
-        time.sleep(0.1)
-    except Exception as e:
-        print(f"Error deleting batch: {e}")
+def count_remaining_slack():
+    """Count the SL-* records left, reading only Slack rows through the source-index GSI."""
+    total = 0
+    query_kwargs = {
+        'IndexName': 'source-index',
+        'KeyConditionExpression': Key('sourceSystem').eq('slack'),
+        'FilterExpression': _SL_FILTER,
+        'Select': 'COUNT'
+    }
+    
+    while True:
+        response = table.query(**query_kwargs)
+        total += response.get('Count', 0)
+        
+        if 'LastEvaluatedKey' not in response:
+            return total
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
 
 def verify_remaining():
     """Check what's left after deletion."""
@@ -97,8 +69,7 @@ def verify_remaining():
     try:
         # Quick sample of remaining Slack records
         response = table.scan(
-            FilterExpression='begins_with(PK, :pk)',
-            ExpressionAttributeValues={':pk': 'SL-'},
+            FilterExpression=_SL_FILTER,
             Limit=5
         )
         
@@ -106,8 +77,9 @@ def verify_remaining():
         print(f"Sample of {len(items)} remaining Slack records:")
         
         for i, item in enumerate(items):
-            text_preview = item.get('text', '')[:100] + ('...' if len(item.get('text', '')) > 100 else '')
-            has_author = 'AUTHOR' in item.get('text', '').upper()
+            text = item.get('text') or ''
+            text_preview = _preview(text)
+            has_author = AUTHOR_RE.search(text) is not None
             print(f"{i+1}. PK: {item.get('PK', 'N/A')}")
             print(f"   Text: {text_preview}")
             print(f"   Has AUTHOR: {has_author}")
@@ -126,6 +98,11 @@ def main():
     try:
         deleted_count, kept_count = scan_and_delete_slack_with_author()
         
+        # Nothing matched, so the remaining sample is unchanged
+        if deleted_count == 0:
+            print("\n✅ No Slack records with 'AUTHOR' found!")
+            return
+        
         verify_remaining()
         
         print(f"\n📊 Expected dashboard results:")
@@ -41,7 +41,7 @@ if [ ! -f ".env" ]; then
     echo
     echo "# AWS Configuration"
     echo "AWS_REGION=us-west-2"
-    echo "DYNAMODB_TABLE=support_data_ingestion"
+    echo "DYNAMODB_TABLE=support_data_ingestion_v2"
     echo
     echo "# Slack Configuration"
     echo "SLACK_BOT_TOKEN=your_slack_bot_token"
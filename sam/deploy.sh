@@ -82,10 +82,40 @@ build_sam() {
     print_success "SAM application built successfully"
 }
 
+# Pick the IndexRolloutStage to deploy unless INDEX_ROLLOUT_STAGE is set:
+# a new stack gets every GSI at once (CreateTable allows it), an existing stack
+# keeps its current stage, and one deployed before the parameter starts at 1.
+# Raise the stage by one per deploy (INDEX_ROLLOUT_STAGE=2, then 3), since
+# DynamoDB adds only one GSI per table update.
+resolve_index_rollout_stage() {
+    if [ -n "$INDEX_ROLLOUT_STAGE" ]; then
+        return
+    fi
+    
+    if ! aws cloudformation describe-stacks --stack-name $STACK_NAME --profile $AWS_PROFILE --region $AWS_REGION &> /dev/null; then
+        INDEX_ROLLOUT_STAGE=3
+        return
+    fi
+    
+    INDEX_ROLLOUT_STAGE=$(aws cloudformation describe-stacks \
+        --stack-name $STACK_NAME \
+        --profile $AWS_PROFILE \
+        --region $AWS_REGION \
+        --query "Stacks[0].Parameters[?ParameterKey=='IndexRolloutStage'].ParameterValue" \
+        --output text)
+    case "$INDEX_ROLLOUT_STAGE" in
+        1|2|3) ;;
+        *) INDEX_ROLLOUT_STAGE=1 ;;
+    esac
+}
+
 # Deploy SAM application
 deploy_sam() {
     print_status "Deploying SAM application..."
     
+    resolve_index_rollout_stage
+    print_status "Using IndexRolloutStage=$INDEX_ROLLOUT_STAGE"
+    
     # Check if .env file exists and extract parameters
     if [ -f "../.env" ]; then
         print_status "Loading parameters from .env file..."
@@ -105,6 +135,7 @@ deploy_sam() {
                 ZendeskEmail="$ZENDESK_EMAIL" \
                 ZendeskApiToken="$ZENDESK_API_TOKEN" \
                 ShortcutApiToken="$SHORTCUT_API_TOKEN" \
+                IndexRolloutStage=$INDEX_ROLLOUT_STAGE \
             --profile $AWS_PROFILE \
             --region $AWS_REGION \
             --no-confirm-changeset \
@@ -116,7 +147,7 @@ deploy_sam() {
         sam deploy \
             --stack-name $STACK_NAME \
             --capabilities CAPABILITY_IAM \
-            --parameter-overrides Environment=$ENVIRONMENT \
+            --parameter-overrides Environment=$ENVIRONMENT IndexRolloutStage=$INDEX_ROLLOUT_STAGE \
             --profile $AWS_PROFILE \
             --region $AWS_REGION \
             --no-confirm-changeset \
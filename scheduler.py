@@ -22,9 +22,22 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# A job falling due this soon after the last ingestion finished is skipped, so
+# overlapping schedules (e.g. hourly and every 6 hours) do not run back to back
+COALESCE_SECONDS = 300
+
+# Monotonic time the last ingestion finished, None before the first run
+_last_finished = None
+
 
 def run_ingestion():
     """Run the data ingestion process"""
+    global _last_finished
+    
+    if _last_finished is not None and time.monotonic() - _last_finished < COALESCE_SECONDS:
+        logger.info("⏭️  Skipping ingestion, the previous run just finished")
+        return
+    
     try:
         logger.info("🚀 Starting scheduled data ingestion...")
         
@@ -42,6 +55,9 @@ def run_ingestion():
     except Exception as e:
         logger.error(f"❌ Error during ingestion: {str(e)}")
         raise
+    
+    finally:
+        _last_finished = time.monotonic()
 
 
 def main():
@@ -80,11 +96,16 @@ def main():
     print("📝 Logs will be saved to 'data_ingestion.log'")
     print()
     
-    # Keep the scheduler running
+    # Keep the scheduler running, sleeping until the next job is due instead
+    # of polling, so jobs start on time rather than up to a minute late
     try:
         while True:
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            idle_seconds = schedule.idle_seconds()
+            if idle_seconds is None:
+                break
+            if idle_seconds > 0:
+                time.sleep(idle_seconds)
             
     except KeyboardInterrupt:
         print()
@@ -20,6 +20,9 @@ fi
 
 echo "✅ Grafana is installed"
 
+# Table dynamodb_data_storage.py writes; override with DYNAMODB_TABLE as it does
+TABLE_NAME="${DYNAMODB_TABLE:-support_data_ingestion_v2}"
+
 # Check if DynamoDB plugin is available
 echo ""
 echo "📦 Installing DynamoDB plugin..."
@@ -53,7 +56,7 @@ echo "   - Search for 'DynamoDB'"
 echo "   - Configure with:"
 echo "     * Name: DynamoDB Support Data"
 echo "     * Region: us-west-2"
-echo "     * Table: support_data_ingestion"
+echo "     * Table: $TABLE_NAME"
 echo "     * Access Key: Your AWS access key"
 echo "     * Secret Key: Your AWS secret key"
 echo ""
@@ -83,7 +86,7 @@ fi
 echo ""
 echo "📊 Available Data in DynamoDB:"
 echo "==============================="
-aws dynamodb scan --table-name support_data_ingestion --select COUNT --profile AdministratorAccess12hr-100142810612 2>/dev/null || echo "   Table not accessible or empty"
+aws dynamodb scan --table-name "$TABLE_NAME" --select COUNT --profile AdministratorAccess12hr-100142810612 2>/dev/null || echo "   Table not accessible or empty"
 
 echo ""
 echo "🎯 Next Steps:"
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the BugTracker cleanup scripts.
+Runs one or more cleanups in order in one process, so the AWS session,
+table handle and connection pool from _aws.py are set up only once.
+Also holds scan_and_delete, the read -> classify -> delete pipeline the
+Slack cleanup scripts are built on.
+
+Usage:
+    python slack_cleanup.py cleanup-slack-invalid cleanup-slack-author
+"""
+
+import argparse
+import importlib
+from boto3.dynamodb.conditions import Key
+
+from _aws import (
+    SCAN_SEGMENTS, TARGET_RCU,
+    batch_delete_keys, client_read_kwargs, get_table, parallel_scan_pages, rate_limited_pages
+)
+
+# Subcommand -> module whose main() runs it (imported only when used)
+COMMANDS = {
+    'cleanup-all': 'complete_db_cleanup',
+    'cleanup-slack-all': 'delete_all_slack_records',
+    'cleanup-slack-author': 'delete_slack_with_author',
+    'cleanup-slack-invalid': 'comprehensive_slack_cleanup',
+    'cleanup-slack-strict': 'strict_slack_cleanup',
+    'cleanup-slack-auto': 'auto_cleanup_slack'
+}
+
+def scan_and_delete(delete_if=None, filter_expression=None, projection='PK, SK',
+                    slack_index=False, total_segments=SCAN_SEGMENTS, label='records'):
+    """
+    Stream records into concurrent batch deletes and return
+    (deleted_count, kept_count, scanned_count).
+    filter_expression is applied server-side; delete_if(item), when given, decides
+    per returned item and the rest are counted as kept. slack_index reads the
+    source-index GSI (sourceSystem = 'slack') instead of a parallel table scan.
+    Without delete_if only the keys matter, so the low-level client is used and
+    items are read in raw attribute-value form without deserialization.
+    """
+    table = get_table()
+    low_level = delete_if is None
+    deleted_count = 0
+    kept_count = 0
+    scanned_count = 0
+    
+    read_kwargs = {
+        'ProjectionExpression': projection,
+        'Select': 'SPECIFIC_ATTRIBUTES'
+    }
+    if '#t' in projection:
+        read_kwargs['ExpressionAttributeNames'] = {'#t': 'text'}
+    if filter_expression is not None:
+        read_kwargs['FilterExpression'] = filter_expression
+    
+    if slack_index:
+        read_kwargs['IndexName'] = 'source-index'
+        read_kwargs['KeyConditionExpression'] = Key('sourceSystem').eq('slack')
+        if low_level:
+            pages = rate_limited_pages(table.meta.client.query, TARGET_RCU, **client_read_kwargs(table, **read_kwargs))
+        else:
+            pages = rate_limited_pages(table.query, TARGET_RCU, **read_kwargs)
+    else:
+        pages = parallel_scan_pages(table, total_segments, TARGET_RCU, low_level=low_level, **read_kwargs)
+    
+    def keys_to_delete():
+        nonlocal kept_count, scanned_count
+        for page in pages:
+            scanned_count += page['ScannedCount']
+            for item in page['Items']:
+                if low_level:
+                    # PK and SK are string attributes
+                    yield item['PK']['S'], item['SK']['S']
+                elif delete_if(item):
+                    yield item['PK'], item['SK']
+                else:
+                    kept_count += 1
+    
+    try:
+        # Keys go to concurrent 25-key batch deletes as the pages arrive
+        for deleted_count in batch_delete_keys(table, keys_to_delete()):
+            if deleted_count % 100 == 0:
+                print(f"Deleted {deleted_count} {label}...")
+    
+    except Exception as e:
+        # Report how far the run got, then fail so callers do not treat partial counts as success
+        print(f"Error during cleanup after deleting {deleted_count} {label}: {e}")
+        raise
+    
+    return deleted_count, kept_count, scanned_count
+
+def main():
+    parser = argparse.ArgumentParser(description="Run BugTracker cleanups in one process.")
+    parser.add_argument(
+        'commands',
+        nargs='+',
+        choices=list(COMMANDS),
+        metavar='command',
+        help=f"cleanup to run, in order: {', '.join(COMMANDS)}"
+    )
+    args = parser.parse_args()
+    
+    for command in args.commands:
+        print(f"\n▶️  {command}")
+        importlib.import_module(COMMANDS[command]).main()
+
+if __name__ == "__main__":
+    main()
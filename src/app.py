@@ -1,12 +1,30 @@
 import os
-import json
 import logging
+import orjson
 from castifi.controller.Controller import Controller
 from castifi.exceptions.Exceptions import BadRequestException, InternalServerErrorException
 
-# Configure logging
+# Configure logging (set LOG_LEVEL=WARNING in production to drop per-request info logs)
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
+
+# CORS headers shared by every error response
+_ERROR_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Headers': '*',
+    'Access-Control-Allow-Methods': '*'
+}
+
+# Expected exception type -> (status code, error name); anything else is a generic 500
+_ERRORS_BY_EXCEPTION = {
+    BadRequestException: (400, 'Bad Request'),
+    InternalServerErrorException: (500, 'Internal Server Error')
+}
+
+# Built once during the init phase and reused by warm invocations; the
+# controller only holds service objects and table handles, no request state
+_CONTROLLER = Controller()
 
 def lambda_handler(event, context):
     """
@@ -14,10 +32,11 @@ def lambda_handler(event, context):
     Routes requests to appropriate controllers based on the event type.
     """
     try:
-        logger.info(f"Received event: {json.dumps(event)}")
+        # Events can be tens of KB; only serialize them when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received event: %s", orjson.dumps(event).decode())
         
-        # Initialize controller
-        controller = Controller()
+        controller = _CONTROLLER
         
         # Route based on event type
         if 'httpMethod' in event:
@@ -30,49 +49,22 @@ def lambda_handler(event, context):
             # Direct invocation or other event types
             return controller.handle_direct_invocation(event, context)
             
-    except BadRequestException as e:
-        logger.error(f"Bad Request: {str(e)}")
-        return {
-            'statusCode': 400,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({
-                'error': 'Bad Request',
-                'message': str(e)
-            })
-        }
-    except InternalServerErrorException as e:
-        logger.error(f"Internal Server Error: {str(e)}")
-        return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({
-                'error': 'Internal Server Error',
-                'message': str(e)
-            })
-        }
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        status_code, error = _ERRORS_BY_EXCEPTION.get(type(e), (500, None))
+        if error:
+            logger.error(f"{error}: {str(e)}")
+            message = str(e)
+        else:
+            # Unexpected errors are logged in full but not echoed to the caller
+            logger.error(f"Unexpected error: {str(e)}")
+            error = 'Internal Server Error'
+            message = 'An unexpected error occurred'
+        
         return {
-            'statusCode': 500,
-            'headers': {
-                'Content-Type': 'application/json',
-                'Access-Control-Allow-Origin': '*',
-                'Access-Control-Allow-Headers': '*',
-                'Access-Control-Allow-Methods': '*'
-            },
-            'body': json.dumps({
-                'error': 'Internal Server Error',
-                'message': 'An unexpected error occurred'
-            })
+            'statusCode': status_code,
+            'headers': _ERROR_HEADERS,
+            'body': orjson.dumps({
+                'error': error,
+                'message': message
+            }).decode()
         }
-
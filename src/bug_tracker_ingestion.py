@@ -1,12 +1,20 @@
 import os
 import re
 import boto3
-import json
-import time
+import ijson
+import orjson
 import logging
 import hashlib
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
-import requests
+from decimal import Decimal
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeSerializer
+from botocore.exceptions import ClientError
 
 # Configure logging
 logger = logging.getLogger()
@@ -16,6 +24,26 @@ logger.setLevel(logging.INFO)
 dynamodb = boto3.resource('dynamodb')
 table_name = os.environ.get('DYNAMODB_TABLE', 'BugTracker')
 table = dynamodb.Table(table_name)
+# Low-level client for bulk writes, sharing the resource's connection pool
+dynamodb_client = dynamodb.meta.client
+
+# In Lambda, resolve credentials and open the DynamoDB TLS connection during
+# the init phase instead of on the first write of the first invocation
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+    try:
+        dynamodb_client.describe_endpoints()
+    except Exception as e:
+        logger.warning(f"DynamoDB pre-warm failed: {str(e)}")
+
+# BatchWriteItem accepts at most 25 put requests per call
+BATCH_WRITE_LIMIT = 25
+
+# Calls per batch before unprocessed items/keys are given up on, so sustained
+# throttling fails the run instead of hanging it until the Lambda times out
+BATCH_MAX_ATTEMPTS = 8
+
+# One shared serializer for low-level attribute values
+_serializer = TypeSerializer()
 
 # API Configuration from environment variables
 SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
@@ -25,11 +53,323 @@ ZENDESK_EMAIL = os.environ.get("ZENDESK_EMAIL")
 ZENDESK_API_TOKEN = os.environ.get("ZENDESK_API_TOKEN")
 SHORTCUT_API_TOKEN = os.environ.get("SHORTCUT_API_TOKEN")
 
+# Sources ingested by default, each fetched on its own thread
+SOURCES = ('slack', 'zendesk', 'shortcut')
+
+# GSI on sourceSystem + syncedAt (keys only) used to find records a sync missed
+STALE_INDEX = 'stale-index'
+
+# Most stale records one check reads, so a large backlog cannot stall an invocation
+STALE_RECORD_LIMIT = 1000
+
+# Zendesk listing pages after the first fetched in parallel
+ZENDESK_PAGE_WORKERS = 4
+
+# Attribute bug_tracker_linker.soft_link_bugs sets on records linked in place
+LINKED_ATTRIBUTE = 'linkedTicketId'
+
+# Credentials are fixed for the container's lifetime, so check them once;
+# Slack channels are built in, SLACK_CHANNEL_ID only adds one
+_SLACK_ENABLED = bool(SLACK_BOT_TOKEN)
+_ZENDESK_ENABLED = bool(ZENDESK_SUBDOMAIN and ZENDESK_EMAIL and ZENDESK_API_TOKEN)
+_SHORTCUT_ENABLED = bool(SHORTCUT_API_TOKEN)
+_SOURCE_ENABLED = {
+    'slack': _SLACK_ENABLED,
+    'zendesk': _ZENDESK_ENABLED,
+    'shortcut': _SHORTCUT_ENABLED
+}
+
+# Item attributes upsert_bug_item sets itself; same-named source attributes are ignored
+_RESERVED_ATTRIBUTES = frozenset(['PK', 'SK', 'sourceSystem', 'createdAt', 'updatedAt'])
+
+# Slack bug-report fields ("priority: high", "zendesk ticket=123", ...) found in
+# one scan. Only the key and separator are consumed; the value is captured in a
+# lookahead so a field packed inside another's value ("priority:high,status:open")
+# is still found, as it was when each field had its own search. The pattern is
+# matched against casefolded text, which is several times faster than IGNORECASE;
+# the IGNORECASE twin covers text whose length casefolding changes.
+_SLACK_FIELDS_PATTERN = r"(?P<key>zendesk\s*ticket|ticketid|priority|stat(?:us|e)|assignee)[:=]\s*(?=(?P<val>\S+))"
+_SLACK_FIELDS_RE = re.compile(_SLACK_FIELDS_PATTERN)
+_SLACK_FIELDS_IGNORECASE_RE = re.compile(_SLACK_FIELDS_PATTERN, re.IGNORECASE)
+
+# Every field key contains one of these; text with none of them has no fields
+_SLACK_FIELD_KEYWORDS = ('ticket', 'priority', 'stat', 'assignee')
+
+# Zendesk ticket reference in a Shortcut story name
+_ZD_RE = re.compile(r"(ZD-\d+)")
+
+# Zendesk status -> normalized state
+_ZD_STATE_MAP = {
+    "new": "open",
+    "open": "open", 
+    "pending": "pending",
+    "hold": "pending",
+    "solved": "closed",
+    "closed": "closed"
+}
+
+# Shortcut workflow state ID -> (readable name, normalized state)
+_SC_STATE_MAP = {
+    "500000027": ("Ready for Dev", "open"),
+    "500000043": ("In Progress", "in_progress"), 
+    "500000385": ("Code Review", "in_progress"),
+    "500003719": ("Ready for QA", "in_progress"),
+    "500009065": ("Blocked", "blocked"),
+    "500000028": ("Done", "closed"),
+    "500000380": ("To Do", "open"),
+    "500008605": ("QA Testing", "in_progress"),
+    "500000042": ("Needs Review", "pending"),
+    "500000063": ("Backlog Refinement", "pending"),
+    "500012485": ("3rd Refinement", "pending"),
+    "500012489": ("Ready for Tech Design Review", "pending")
+}
+
+# Shortcut standard priority field (lowercased) -> display priority
+_SC_PRIORITY_MAP = {
+    "high": "High",
+    "medium": "Medium", 
+    "low": "Low",
+    "critical": "Critical"
+}
+
+
+
+# One requests.Session per thread: Session is not documented as thread-safe,
+# and the source, Slack channel and Zendesk page threads fetch concurrently
+_http = threading.local()
+
+
+def get_http_session():
+    """
+    Return the calling thread's HTTP session, importing requests on first use.
+    The API Lambda imports this module for every query and link request,
+    so requests is only loaded once an ingestion actually fetches. Pooled
+    keep-alive connections are reused across the pages a thread fetches, and
+    429/5xx responses are retried with backoff (honouring Retry-After)
+    before raise_for_status sees them.
+    """
+    session = getattr(_http, 'session', None)
+    if session is not None:
+        return session
+    
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = _http.session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+    ))
+    return session
+
+
+def _dynamodb_value(value):
+    """Convert an attribute value for DynamoDB: floats become Decimal, recursing into dicts and lists"""
+    if isinstance(value, float):
+        # DynamoDB rejects float; str() keeps the shortest exact repr
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: _dynamodb_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_dynamodb_value(item) for item in value]
+    return value
+
+
+def _write_batch(items):
+    """
+    Put up to 25 items with one low-level BatchWriteItem call and resend
+    unprocessed items with jittered exponential backoff.
+    """
+    request_items = {table_name: [
+        {'PutRequest': {'Item': {name: _serializer.serialize(value) for name, value in item.items()}}}
+        for item in items
+    ]}
+    attempt = 0
+    
+    while request_items:
+        response = dynamodb_client.batch_write_item(RequestItems=request_items)
+        request_items = response.get('UnprocessedItems')
+        if request_items:
+            attempt += 1
+            if attempt >= BATCH_MAX_ATTEMPTS:
+                raise RuntimeError(
+                    f"{len(request_items[table_name])} items still unprocessed after {attempt} BatchWriteItem attempts"
+                )
+            # Full jitter so throttled writers do not retry in lockstep
+            time.sleep(random.uniform(0, min(1.0, 0.05 * 2 ** attempt)))
+
+
+def _carry_over_links(items):
+    """
+    Keep soft links across re-ingestion. Items are written whole, which would
+    drop linkedTicketId and put the record back in the unlinked index, so the
+    stored link of every SL-* item about to be written is read first (one
+    BatchGetItem per batch) and carried over in place of unlinkedFlag.
+    """
+    keys = [
+        {'PK': {'S': item['PK']}, 'SK': {'S': item['SK']}}
+        for item in items if 'unlinkedFlag' in item
+    ]
+    if not keys:
+        return
+    
+    links = {}
+    request_items = {table_name: {'Keys': keys, 'ProjectionExpression': f"PK, SK, {LINKED_ATTRIBUTE}"}}
+    attempt = 0
+    while request_items:
+        response = dynamodb_client.batch_get_item(RequestItems=request_items)
+        for record in response.get('Responses', {}).get(table_name, []):
+            if LINKED_ATTRIBUTE in record:
+                links[(record['PK']['S'], record['SK']['S'])] = record[LINKED_ATTRIBUTE]['S']
+        request_items = response.get('UnprocessedKeys')
+        if request_items:
+            attempt += 1
+            if attempt >= BATCH_MAX_ATTEMPTS:
+                raise RuntimeError(
+                    f"{len(request_items[table_name]['Keys'])} keys still unprocessed after {attempt} BatchGetItem attempts"
+                )
+            time.sleep(random.uniform(0, min(1.0, 0.05 * 2 ** attempt)))
+    
+    for item in items:
+        link = links.get((item['PK'], item['SK']))
+        if link:
+            item[LINKED_ATTRIBUTE] = link
+            del item['unlinkedFlag']
+
+
+def _iter_json_array(response, array_key, meta):
+    """
+    Parse a streamed (stream=True) JSON response with ijson and yield the
+    elements of its top-level array_key one at a time, without holding the
+    whole body. Top-level scalar fields (e.g. the next-page cursor) go into
+    meta, which is complete once the generator is exhausted.
+    """
+    response.raw.decode_content = True
+    item_prefix = f"{array_key}.item"
+    builder = None
+    
+    for prefix, event, value in ijson.parse(response.raw):
+        if builder is not None:
+            builder.event(event, value)
+            # The element's own closing event ends it; nested ones have longer prefixes
+            if prefix == item_prefix and event in ('end_map', 'end_array'):
+                yield builder.value
+                builder = None
+        elif prefix == item_prefix:
+            if event in ('start_map', 'start_array'):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield value
+        elif prefix and '.' not in prefix and event in ('string', 'number', 'boolean', 'null'):
+            meta[prefix] = value
+
+
+def _zendesk_page(url, auth, params):
+    """Fetch one page of a Zendesk listing and return its tickets."""
+    response = get_http_session().get(url, auth=auth, params=params, timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content).get("tickets", [])
+
+
+def _paginate_zendesk(url, auth, params):
+    """
+    Yield Zendesk tickets in page order. Page 1 is streamed; its count gives
+    the page total, and the remaining pages are fetched ZENDESK_PAGE_WORKERS
+    at a time in parallel, so at most that many pages are held at once.
+    """
+    meta = {}
+    page_count = 0
+    with get_http_session().get(url, auth=auth, params=params, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        for ticket in _iter_json_array(response, "tickets", meta):
+            page_count += 1
+            yield ticket
+    
+    if not page_count:  # No tickets at all
+        return
+    logger.info(f"Fetched a page of {page_count} Zendesk tickets")
+    
+    last_page = -(-(meta.get("count") or 0) // params["per_page"])
+    with ThreadPoolExecutor(max_workers=ZENDESK_PAGE_WORKERS) as executor:
+        for first_page in range(2, last_page + 1, ZENDESK_PAGE_WORKERS):
+            pages = range(first_page, min(first_page + ZENDESK_PAGE_WORKERS, last_page + 1))
+            for tickets in executor.map(lambda page: _zendesk_page(url, auth, dict(params, page=page)), pages):
+                if not tickets:  # No more tickets to fetch
+                    return
+                logger.info(f"Fetched a page of {len(tickets)} Zendesk tickets")
+                yield from tickets
+
+
+def _paginate_shortcut(url, headers, params):
+    """Yield Shortcut search results as each page streams in, following the next cursor."""
+    while url:
+        meta = {}
+        page_count = 0
+        with get_http_session().get(url, headers=headers, params=params, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            for story in _iter_json_array(response, "data", meta):
+                page_count += 1
+                yield story
+        
+        logger.info(f"Fetched a page of {page_count} Shortcut stories")
+        
+        # next is a path that already carries the query and the page cursor
+        next_path = meta.get("next")
+        url = f"https://api.app.shortcut.com{next_path}" if next_path else None
+        params = None
+
 
 class BugTrackerIngestion:
     def __init__(self):
         self.table = table
+        self.start_run()
+        # Pending batch items keyed by (PK, SK) while inside batch_writes(), else None
+        self._batch = None
+        # The pending batch and ingestion_count are shared by the fetch threads
+        self._write_lock = threading.Lock()
+    
+    def start_run(self):
+        """
+        Reset the per-run state: the processed count and the run timestamp.
+        Every record written in a run shares one updatedAt/syncedAt value, so
+        the stale-record check sees the whole run as synced at the same moment.
+        """
         self.ingestion_count = 0
+        self._now_iso = datetime.now().isoformat()
+    
+    @contextmanager
+    def batch_writes(self):
+        """
+        Send upsert_bug_item writes through low-level 25-item BatchWriteItem
+        calls until the block exits, then flush the remainder.
+        A later write to the same (PK, SK) replaces the pending one, since a
+        single BatchWriteItem call may not repeat a key.
+        """
+        self._batch = {}
+        try:
+            yield
+        finally:
+            with self._write_lock:
+                items = list(self._batch.values())
+                self._batch = None
+            if items:
+                self._flush_batch(items)
+    
+    def _flush_batch(self, items):
+        """
+        Write a batch already swapped out of _batch. Called without holding
+        _write_lock, so the DynamoDB round trips never block other fetch threads.
+        """
+        _carry_over_links(items)
+        _write_batch(items)
     
     def upsert_bug_item(self, ticket_id, source_system, record_id, attributes):
         """
@@ -38,34 +378,53 @@ class BugTrackerIngestion:
         Args:
             ticket_id: The unified ticket ID (e.g., ZD-12345, SC-56789, SL-9876543210.12345)
             source_system: The source system (slack, zendesk, shortcut)
-            record_id: The record ID from the source system
+            record_id: The record ID from the source system (str or int)
             attributes: Dictionary of attributes to store
         """
         try:
-            # Create the sort key
+            # Create the sort key; the f-string formats int ids itself, no str() needed
             sk = f"{source_system}#{record_id}"
             
-            # Prepare the item
+            # Prepare the item; nested attribute values are stored as native maps and lists
             item = {
                 'PK': ticket_id,
                 'SK': sk,
                 'sourceSystem': source_system,
-                'createdAt': attributes.get('createdAt', datetime.now().isoformat()),
-                'updatedAt': datetime.now().isoformat()
+                'createdAt': attributes.get('createdAt', self._now_iso),
+                'updatedAt': self._now_iso,
+                **{
+                    key: _dynamodb_value(value)
+                    for key, value in attributes.items()
+                    if key not in _RESERVED_ATTRIBUTES
+                }
             }
             
-            # Add all other attributes
-            for key, value in attributes.items():
-                if key not in ['PK', 'SK', 'sourceSystem', 'createdAt', 'updatedAt']:
-                    if isinstance(value, (dict, list)):
-                        item[key] = json.dumps(value)
-                    else:
-                        item[key] = value
+            # Unlinked Slack records carry unlinkedFlag so they appear in the
+            # sparse unlinked-index; linking re-keys them or soft-links them
+            # (carried over on write) and removes it
+            if source_system == 'slack' and ticket_id.startswith('SL-'):
+                item['unlinkedFlag'] = 'SL'
             
-            # Upsert the item
-            self.table.put_item(Item=item)
-            self.ingestion_count += 1
-            logger.info(f"Upserted [{ticket_id}] from [{source_system}] → {attributes.get('subject', attributes.get('text', attributes.get('name', 'No title')))}")
+            # Upsert the item, batched when inside batch_writes(). Only the
+            # pending batch is touched under the lock; a full batch is swapped
+            # out and written after releasing it.
+            full_batch = None
+            with self._write_lock:
+                batched = self._batch is not None
+                if batched:
+                    self._batch[(ticket_id, sk)] = item
+                    if len(self._batch) >= BATCH_WRITE_LIMIT:
+                        full_batch, self._batch = list(self._batch.values()), {}
+                self.ingestion_count += 1
+            
+            if not batched:
+                _carry_over_links([item])
+                self.table.put_item(Item=item)
+            elif full_batch:
+                self._flush_batch(full_batch)
+            # Per-item audit line at DEBUG only; each fetcher logs a summary at INFO
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Upserted [{ticket_id}] from [{source_system}] → {attributes.get('subject', attributes.get('text', attributes.get('name', 'No title')))}")
             
         except Exception as e:
             logger.error(f"Error upserting item: {str(e)}")
@@ -73,40 +432,44 @@ class BugTrackerIngestion:
     
     def extract_ticket_info_from_slack(self, text):
         """Extract ticketId, priority, status, and other fields from Slack text."""
-        # Look for various ticket ID patterns
-        ticket_pattern = re.search(r"ticketId[:=]\s*(\S+)", text, re.IGNORECASE)
-        
-        # NEW: Look for Zendesk Ticket field (takes priority over ticketId)
-        zendesk_ticket_pattern = re.search(r"zendesk\s*ticket[:=]\s*(\S+)", text, re.IGNORECASE)
-        
-        # Look for priority patterns (support both old and new formats)
-        priority_pattern = re.search(r"priority[:=]\s*(\S+)", text, re.IGNORECASE)
+        # Scan the text once; the first occurrence of each field wins. Values
+        # are sliced from the original text so their case is kept.
+        folded = text.casefold()
+        if not any(keyword in folded for keyword in _SLACK_FIELD_KEYWORDS):
+            # Plain substring checks are far cheaper than the regex scan
+            matches = ()
+        elif len(folded) == len(text):
+            matches = _SLACK_FIELDS_RE.finditer(folded)
+        else:
+            matches = _SLACK_FIELDS_IGNORECASE_RE.finditer(text)
         
-        # Other existing patterns
-        status_pattern = re.search(r"status[:=]\s*(\S+)", text, re.IGNORECASE)
-        state_pattern = re.search(r"state[:=]\s*(\S+)", text, re.IGNORECASE)
-        assignee_pattern = re.search(r"assignee[:=]\s*(\S+)", text, re.IGNORECASE)
+        fields = {}
+        for match in matches:
+            key = match.group('key').casefold()
+            if key.startswith('zendesk'):
+                key = 'zendesk_ticket'
+            fields.setdefault(key, text[match.start('val'):match.end('val')])
         
         # Extract subject from first line or before first newline
         subject = text.split('\n')[0][:100] if text else "Slack Message"
         
         # Determine ticket ID: Zendesk Ticket takes priority, then ticketId, then generate one
-        if zendesk_ticket_pattern:
-            ticket_id = zendesk_ticket_pattern.group(1)
+        if 'zendesk_ticket' in fields:
+            ticket_id = fields['zendesk_ticket']
             # If it doesn't start with ZD-, add the prefix
             if not ticket_id.upper().startswith('ZD-'):
                 ticket_id = f"ZD-{ticket_id}"
-        elif ticket_pattern:
-            ticket_id = ticket_pattern.group(1)
+        elif 'ticketid' in fields:
+            ticket_id = fields['ticketid']
         else:
             # Use deterministic hash to prevent duplicates across ingestion runs
             text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()[:12]
             ticket_id = f"SL-{text_hash}"
         
-        priority = priority_pattern.group(1).capitalize() if priority_pattern else "Medium"
-        status = status_pattern.group(1).capitalize() if status_pattern else "Open"
-        state = state_pattern.group(1).capitalize() if state_pattern else "open"
-        assignee = assignee_pattern.group(1) if assignee_pattern else None
+        priority = fields['priority'].capitalize() if 'priority' in fields else "Medium"
+        status = fields['status'].capitalize() if 'status' in fields else "Open"
+        state = fields['state'].capitalize() if 'state' in fields else "open"
+        assignee = fields.get('assignee')
 
         return {
             'ticket_id': ticket_id,
@@ -118,12 +481,12 @@ class BugTrackerIngestion:
         }
     
     def fetch_slack_messages(self):
-        """Fetch Slack messages from multiple channels and normalize into bug records."""
+        """Fetch Slack messages from multiple channels, upsert them as bug records and return how many."""
         logger.info("Fetching Slack messages from multiple channels...")
         
-        if not SLACK_BOT_TOKEN:
+        if not _SLACK_ENABLED:
             logger.warning("Slack bot token missing, skipping Slack ingestion")
-            return []
+            return 0
         
         # Define channels to monitor for bug reports
         # Format: [(channel_id, channel_name), ...]
@@ -138,122 +501,105 @@ class BugTrackerIngestion:
         if SLACK_CHANNEL_ID and not any(ch[0] == SLACK_CHANNEL_ID for ch in channels_to_monitor):
             channels_to_monitor.append((SLACK_CHANNEL_ID, "configured-channel"))
         
-        all_results = []
-        
-        for channel_id, channel_name in channels_to_monitor:
-            try:
-                logger.info(f"Fetching messages from #{channel_name} ({channel_id})")
+        # Channels are independent and each call is pure network wait, so fetch them together
+        with ThreadPoolExecutor(max_workers=len(channels_to_monitor)) as executor:
+            total_count = sum(executor.map(lambda channel: self._fetch_slack_channel(*channel), channels_to_monitor))
+
+        logger.info(f"Total Slack records processed: {total_count} from {len(channels_to_monitor)} channels")
+        return total_count
+    
+    def _fetch_slack_channel(self, channel_id, channel_name):
+        """Fetch one Slack channel's recent messages, upsert the bug reports and return how many."""
+        try:
+            logger.info(f"Fetching messages from #{channel_name} ({channel_id})")
+            
+            url = "https://slack.com/api/conversations.history"
+            headers = {"Authorization": f"Bearer {SLACK_BOT_TOKEN}"}
+            params = {"channel": channel_id, "limit": 50}
+            response = get_http_session().get(url, headers=headers, params=params, timeout=10)
+            response.raise_for_status()
+
+            data = orjson.loads(response.content)
+            if not data.get("ok"):
+                logger.warning(f"Slack API error for #{channel_name}: {data.get('error', 'Unknown error')}")
+                return 0
+                
+            messages = data.get("messages", [])
+            channel_count = 0
+
+            for msg in messages:
+                text = msg.get("text", "")
                 
-                url = "https://slack.com/api/conversations.history"
-                headers = {"Authorization": f"Bearer {SLACK_BOT_TOKEN}"}
-                params = {"channel": channel_id, "limit": 50}
-                response = requests.get(url, headers=headers, params=params, timeout=10)
-                response.raise_for_status()
-
-                data = response.json()
-                if not data.get("ok"):
-                    logger.warning(f"Slack API error for #{channel_name}: {data.get('error', 'Unknown error')}")
+                # Filter: Only process messages that contain "AUTHOR" (bug report format)
+                if "AUTHOR" not in text.upper():
                     continue
-                    
-                messages = data.get("messages", [])
-                channel_results = []
+                
+                # Every message has a ts (its id and epoch seconds); parse it once
+                msg_id = msg.get("ts")
+                if not msg_id:
+                    continue
+                posted_at = datetime.fromtimestamp(float(msg_id)).isoformat()
+                
+                extracted_info = self.extract_ticket_info_from_slack(text)
 
-                for msg in messages:
-                    text = msg.get("text", "")
-                    
-                    # Filter: Only process messages that contain "AUTHOR" (bug report format)
-                    if "AUTHOR" not in text.upper():
-                        continue
-                    
-                    extracted_info = self.extract_ticket_info_from_slack(text)
-                    msg_id = msg.get("ts", str(time.time()))
-
-                    # Include channel information in the ticket ID and bug data
-                    channel_suffix = f"#{channel_name}"
-                    ticket_id_with_channel = f"{extracted_info['ticket_id']}-{channel_id}"
-
-                    bug_data = {
-                        "author": msg.get("user", "unknown"),
-                        "text": text,
-                        "priority": extracted_info['priority'],
-                        "status": extracted_info['status'],
-                        "state": extracted_info['state'],
-                        "subject": f"{extracted_info['subject']} ({channel_suffix})",
-                        "assignee": extracted_info['assignee'],
-                        "channel": channel_name,
-                        "channel_id": channel_id,
-                        "createdAt": datetime.fromtimestamp(float(msg["ts"])).isoformat(),
-                        "sourceUpdatedAt": datetime.fromtimestamp(float(msg["ts"])).isoformat(),  # Slack messages don't change
-                        "syncedAt": datetime.now().isoformat()   # Track when we synced this record
-                    }
+                # Include channel information in the ticket ID and bug data
+                channel_suffix = f"#{channel_name}"
+                ticket_id_with_channel = f"{extracted_info['ticket_id']}-{channel_id}"
 
-                    self.upsert_bug_item(ticket_id_with_channel, "slack", f"{channel_id}#{msg_id}", bug_data)
-                    channel_results.append((ticket_id_with_channel, bug_data))
+                bug_data = {
+                    "author": msg.get("user", "unknown"),
+                    "text": text,
+                    "priority": extracted_info['priority'],
+                    "status": extracted_info['status'],
+                    "state": extracted_info['state'],
+                    "subject": f"{extracted_info['subject']} ({channel_suffix})",
+                    "assignee": extracted_info['assignee'],
+                    "channel": channel_name,
+                    "channel_id": channel_id,
+                    "createdAt": posted_at,
+                    "sourceUpdatedAt": posted_at,  # Slack messages don't change
+                    "syncedAt": self._now_iso   # Track when we synced this record
+                }
 
-                logger.info(f"Processed {len(channel_results)} messages from #{channel_name}")
-                all_results.extend(channel_results)
+                self.upsert_bug_item(ticket_id_with_channel, "slack", f"{channel_id}#{msg_id}", bug_data)
+                channel_count += 1
 
-            except Exception as e:
-                logger.error(f"Error fetching messages from #{channel_name} ({channel_id}): {str(e)}")
-                continue
+            logger.info(f"Processed {channel_count} messages from #{channel_name}")
+            return channel_count
 
-        logger.info(f"Total Slack records processed: {len(all_results)} from {len(channels_to_monitor)} channels")
-        return all_results
+        except Exception as e:
+            logger.error(f"Error fetching messages from #{channel_name} ({channel_id}): {str(e)}")
+            return 0
     
     def fetch_zendesk_tickets(self):
-        """Fetch ALL Zendesk tickets and normalize into bug records with proper state sync."""
+        """Fetch ALL Zendesk tickets, upsert them as bug records with proper state sync and return how many."""
         logger.info("Fetching ALL Zendesk tickets for complete state synchronization...")
         
-        if not ZENDESK_SUBDOMAIN or not ZENDESK_EMAIL or not ZENDESK_API_TOKEN:
+        if not _ZENDESK_ENABLED:
             logger.warning("Zendesk configuration missing, skipping Zendesk ingestion")
-            return []
+            return 0
+        
+        processed_count = 0
+        closed_count = 0
+        active_count = 0
         
         try:
-            all_tickets = []
-            next_page_url = f"https://{ZENDESK_SUBDOMAIN}.zendesk.com/api/v2/tickets.json?per_page=100&sort_by=created_at&sort_order=desc"
-            
-            while next_page_url:
-                # Use cursor-based pagination (next_page) instead of page numbers
-                auth = (f"{ZENDESK_EMAIL}/token", ZENDESK_API_TOKEN)
-                response = requests.get(next_page_url, auth=auth, timeout=10)
-                response.raise_for_status()
-
-                data = response.json()
-                tickets = data.get("tickets", [])
-                
-                if not tickets:  # No more tickets to fetch
-                    break
-                    
-                all_tickets.extend(tickets)
-                logger.info(f"Fetched {len(tickets)} tickets, total so far: {len(all_tickets)} - Using cursor-based pagination")
-                
-                # Get next page URL from response (cursor-based pagination)
-                next_page_url = data.get("next_page")
-                
+            # Tickets are written as pages arrive, so only a few pages are held in memory
+            url = f"https://{ZENDESK_SUBDOMAIN}.zendesk.com/api/v2/tickets.json"
+            params = {"per_page": 100, "sort_by": "created_at", "sort_order": "desc"}
+            auth = (f"{ZENDESK_EMAIL}/token", ZENDESK_API_TOKEN)
+
+            for t in _paginate_zendesk(url, auth, params):
                 # Safety limit to prevent infinite loops
-                if len(all_tickets) > 15000:  # Reasonable limit for all tickets
-                    logger.warning(f"Reached ticket limit ({len(all_tickets)}), stopping pagination")
+                if processed_count >= 15000:  # Reasonable limit for all tickets
+                    logger.warning(f"Reached ticket limit ({processed_count}), stopping pagination")
                     break
-
-            results = []
-            closed_count = 0
-            active_count = 0
-
-            for t in all_tickets:
+                
                 ticket_id = f"ZD-{t['id']}"
                 ticket_status = t.get("status", "").lower()
                 
                 # Map Zendesk status to our normalized state
-                state_mapping = {
-                    "new": "open",
-                    "open": "open", 
-                    "pending": "pending",
-                    "hold": "pending",
-                    "solved": "closed",
-                    "closed": "closed"
-                }
-                
-                normalized_state = state_mapping.get(ticket_status, ticket_status)
+                normalized_state = _ZD_STATE_MAP.get(ticket_status, ticket_status)
                 
                 # Track counts for logging
                 if normalized_state == "closed":
@@ -273,18 +619,18 @@ class BugTrackerIngestion:
                     "createdAt": t.get("created_at"),
                     "updatedAt": t.get("updated_at"),
                     "sourceUpdatedAt": t.get("updated_at"),  # Track source system updates
-                    "syncedAt": datetime.now().isoformat()   # Track when we synced this record
+                    "syncedAt": self._now_iso   # Track when we synced this record
                 }
                 
-                self.upsert_bug_item(ticket_id, "zendesk", str(t['id']), bug_data)
-                results.append((ticket_id, bug_data))
+                self.upsert_bug_item(ticket_id, "zendesk", t['id'], bug_data)
+                processed_count += 1
 
-            logger.info(f"Processed {len(results)} total Zendesk tickets: {active_count} active, {closed_count} closed")
-            return results
+            logger.info(f"Processed {processed_count} total Zendesk tickets: {active_count} active, {closed_count} closed")
 
         except Exception as e:
-            logger.error(f"Error fetching Zendesk tickets: {str(e)}")
-            return []
+            logger.error(f"Error fetching Zendesk tickets after {processed_count} tickets: {str(e)}")
+        
+        return processed_count
     
     def fetch_shortcut_users(self):
         """Fetch Shortcut users for name mapping"""
@@ -296,10 +642,10 @@ class BugTrackerIngestion:
         try:
             url = "https://api.app.shortcut.com/api/v3/members"
             headers = {"Shortcut-Token": SHORTCUT_API_TOKEN}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = get_http_session().get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
-            users = response.json()
+            users = orjson.loads(response.content)
             user_map = {}
             
             for user in users:
@@ -315,12 +661,16 @@ class BugTrackerIngestion:
             return {}
 
     def fetch_shortcut_bugs(self):
-        """Fetch ALL Shortcut bug stories and normalize into bug records with proper state sync."""
+        """Fetch ALL Shortcut bug stories, upsert them as bug records with proper state sync and return how many."""
         logger.info("Fetching ALL Shortcut bug stories for complete state synchronization...")
         
-        if not SHORTCUT_API_TOKEN:
+        if not _SHORTCUT_ENABLED:
             logger.warning("Shortcut configuration missing, skipping Shortcut ingestion")
-            return []
+            return 0
+        
+        processed_count = 0
+        completed_count = 0
+        active_count = 0
         
         try:
             # First, get user mapping for owner names
@@ -334,22 +684,12 @@ class BugTrackerIngestion:
                 "page_size": 100,
                 "detail": "full"  # This should include custom fields
             }
-            
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-            all_bugs = data.get("data", [])
-            logger.info(f"Fetched {len(all_bugs)} Shortcut bug stories using search endpoint")
-
-            results = []
-            completed_count = 0
-            active_count = 0
 
-            for bug in all_bugs:
+            # Follow every search page, writing stories as each page arrives
+            for bug in _paginate_shortcut(url, headers, params):
                 ticket_id = None
                 if bug.get("name") and "ZD-" in bug["name"]:  # try to extract Zendesk ID
-                    match = re.search(r"(ZD-\d+)", bug["name"])
+                    match = _ZD_RE.search(bug["name"])
                     if match:
                         ticket_id = match.group(1)
 
@@ -362,28 +702,11 @@ class BugTrackerIngestion:
                 archived = bug.get("archived", False)
                 
                 # Map workflow state ID to readable name and normalized state
-                workflow_mapping = {
-                    "500000027": {"name": "Ready for Dev", "state": "open"},
-                    "500000043": {"name": "In Progress", "state": "in_progress"}, 
-                    "500000385": {"name": "Code Review", "state": "in_progress"},
-                    "500003719": {"name": "Ready for QA", "state": "in_progress"},
-                    "500009065": {"name": "Blocked", "state": "blocked"},
-                    "500000028": {"name": "Done", "state": "closed"},
-                    "500000380": {"name": "To Do", "state": "open"},
-                    "500008605": {"name": "QA Testing", "state": "in_progress"},
-                    "500000042": {"name": "Needs Review", "state": "pending"},
-                    "500000063": {"name": "Backlog Refinement", "state": "pending"},
-                    "500012485": {"name": "3rd Refinement", "state": "pending"},
-                    "500012489": {"name": "Ready for Tech Design Review", "state": "pending"}
-                }
-                
-                workflow_info = workflow_mapping.get(str(workflow_state_id), {
-                    "name": f"Unknown ({workflow_state_id})", 
-                    "state": "unknown"
-                })
-                
-                status_name = workflow_info["name"]
-                normalized_state = workflow_info["state"]
+                workflow_info = _SC_STATE_MAP.get(str(workflow_state_id))
+                if workflow_info:
+                    status_name, normalized_state = workflow_info
+                else:
+                    status_name, normalized_state = f"Unknown ({workflow_state_id})", "unknown"
                 
                 # Override state based on completion status
                 if completed or archived:
@@ -434,13 +757,7 @@ class BugTrackerIngestion:
                 
                 # Fallback: check standard priority field (if it exists)
                 elif bug.get("priority"):
-                    priority_mapping = {
-                        "high": "High",
-                        "medium": "Medium", 
-                        "low": "Low",
-                        "critical": "Critical"
-                    }
-                    priority = priority_mapping.get(bug.get("priority", "").lower(), bug.get("priority", "Medium"))
+                    priority = _SC_PRIORITY_MAP.get(bug.get("priority", "").lower(), bug.get("priority", "Medium"))
                 elif bug.get("story_type") == "bug":
                     priority = "High"  # Final fallback for bugs without explicit priority
                 
@@ -464,21 +781,21 @@ class BugTrackerIngestion:
                     "createdAt": bug.get("created_at"),
                     "updatedAt": bug.get("updated_at"),
                     "sourceUpdatedAt": bug.get("updated_at"),  # Track source system updates
-                    "syncedAt": datetime.now().isoformat(),   # Track when we synced this record
+                    "syncedAt": self._now_iso,   # Track when we synced this record
                     "completed": completed,
                     "archived": archived,
                     "workflow_state_id": workflow_state_id
                 }
                 
-                self.upsert_bug_item(ticket_id, "shortcut", str(bug['id']), bug_data)
-                results.append((ticket_id, bug_data))
+                self.upsert_bug_item(ticket_id, "shortcut", bug['id'], bug_data)
+                processed_count += 1
 
-            logger.info(f"Processed {len(results)} total Shortcut stories: {active_count} active, {completed_count} completed")
-            return results
+            logger.info(f"Processed {processed_count} total Shortcut stories: {active_count} active, {completed_count} completed")
 
         except Exception as e:
-            logger.error(f"Error fetching Shortcut bugs: {str(e)}")
-            return []
+            logger.error(f"Error fetching Shortcut bugs after {processed_count} stories: {str(e)}")
+        
+        return processed_count
     
     def cleanup_stale_records(self, cutoff_hours=24):
         """Mark records as stale if they haven't been synced recently"""
@@ -489,13 +806,27 @@ class BugTrackerIngestion:
             cutoff_time = datetime.now() - timedelta(hours=cutoff_hours)
             cutoff_iso = cutoff_time.isoformat()
             
-            # Scan for records that haven't been synced recently
-            response = self.table.scan(
-                FilterExpression='attribute_not_exists(syncedAt) OR syncedAt < :cutoff',
-                ExpressionAttributeValues={':cutoff': cutoff_iso}
-            )
-            
-            stale_records = response.get('Items', [])
+            # Query each source's slice of stale-index for records synced before the
+            # cutoff, reading only those rather than scanning the whole table
+            stale_records = []
+            try:
+                for source in SOURCES:
+                    kwargs = {
+                        'IndexName': STALE_INDEX,
+                        'KeyConditionExpression': Key('sourceSystem').eq(source) & Key('syncedAt').lt(cutoff_iso)
+                    }
+                    while len(stale_records) < STALE_RECORD_LIMIT:
+                        response = self.table.query(Limit=STALE_RECORD_LIMIT - len(stale_records), **kwargs)
+                        stale_records.extend(response.get('Items', []))
+                        if 'LastEvaluatedKey' not in response:
+                            break
+                        kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+            except ClientError as e:
+                # stale-index only exists from IndexRolloutStage 3; until then skip the check
+                if e.response['Error']['Code'] == 'ValidationException' and 'index' in e.response['Error']['Message']:
+                    logger.warning(f"{STALE_INDEX} does not exist yet (IndexRolloutStage below 3), skipping the stale record check")
+                    return 0
+                raise
             
             if stale_records:
                 logger.info(f"Found {len(stale_records)} potentially stale records")
@@ -514,27 +845,55 @@ class BugTrackerIngestion:
             logger.error(f"Error during stale record cleanup: {str(e)}")
             return 0
 
+    def fetch_sources(self, sources=SOURCES):
+        """
+        Fetch the given sources concurrently and return {source: records processed}.
+        The fetchers are independent and mostly wait on HTTPS, so the run takes
+        as long as the slowest source rather than the sum of all three.
+        Sources without credentials are skipped without starting a thread.
+        """
+        fetchers = {
+            'slack': self.fetch_slack_messages,
+            'zendesk': self.fetch_zendesk_tickets,
+            'shortcut': self.fetch_shortcut_bugs
+        }
+        results = {source: 0 for source in fetchers}
+        sources = [source for source in sources if _SOURCE_ENABLED[source]]
+        if not sources:
+            logger.warning("No sources are configured, nothing to ingest")
+            return results
+        
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {executor.submit(fetchers[source]): source for source in sources}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+
     def ingest_all_data(self):
         """Ingest data from all sources using the unified schema with state synchronization"""
         logger.info("Starting BugTracker data ingestion with comprehensive state synchronization...")
         
-        # Perform comprehensive ingestion from all sources
-        slack_records = self.fetch_slack_messages()
-        zendesk_records = self.fetch_zendesk_tickets()
-        shortcut_records = self.fetch_shortcut_bugs()
+        # The instance may be reused across warm invocations; start a fresh run
+        self.start_run()
+        
+        # Perform comprehensive ingestion from all sources; writes are flushed
+        # before the stale-record check below reads the table
+        with self.batch_writes():
+            fetched = self.fetch_sources()
         
         # Cleanup stale records that weren't updated in this sync
         stale_count = self.cleanup_stale_records()
         
-        total_records = len(slack_records) + len(zendesk_records) + len(shortcut_records)
+        total_records = sum(fetched.values())
         logger.info(f"Ingestion complete. Total records processed: {total_records}, Stale records: {stale_count}")
         
         return {
             'message': 'BugTracker ingestion completed with full state synchronization',
             'total_records': total_records,
-            'slack_records': len(slack_records),
-            'zendesk_records': len(zendesk_records),
-            'shortcut_records': len(shortcut_records),
+            'slack_records': fetched['slack'],
+            'zendesk_records': fetched['zendesk'],
+            'shortcut_records': fetched['shortcut'],
             'stale_records': stale_count,
             'ingestion_count': self.ingestion_count
         }
@@ -556,7 +915,7 @@ def lambda_handler(event, context):
         body = event.get('body', '{}')
         if isinstance(body, str):
             try:
-                params = json.loads(body)
+                params = orjson.loads(body)
             except:
                 params = {}
         else:
@@ -570,32 +929,22 @@ def lambda_handler(event, context):
         logger.info(f"Starting ingestion with params: incremental={incremental}, source={source_filter}, cleanup_stale={cleanup_stale}")
         
         # Perform targeted ingestion based on parameters
-        slack_records = []
-        zendesk_records = []
-        shortcut_records = []
+        sources = [source for source in SOURCES if not source_filter or source_filter == source]
         
-        if not source_filter or source_filter == 'slack':
-            slack_records = ingestion.fetch_slack_messages()
-            
-        if not source_filter or source_filter == 'zendesk':
-            zendesk_records = ingestion.fetch_zendesk_tickets()
-            
-        if not source_filter or source_filter == 'shortcut':
-            shortcut_records = ingestion.fetch_shortcut_bugs()
+        with ingestion.batch_writes():
+            fetched = ingestion.fetch_sources(sources)
         
         # Cleanup stale records if requested
         stale_count = 0
         if cleanup_stale:
             stale_count = ingestion.cleanup_stale_records()
         
-        total_records = len(slack_records) + len(zendesk_records) + len(shortcut_records)
-        
         result = {
             'message': 'BugTracker ingestion completed with full state synchronization',
-            'total_records': total_records,
-            'slack_records': len(slack_records),
-            'zendesk_records': len(zendesk_records),
-            'shortcut_records': len(shortcut_records),
+            'total_records': sum(fetched.values()),
+            'slack_records': fetched['slack'],
+            'zendesk_records': fetched['zendesk'],
+            'shortcut_records': fetched['shortcut'],
             'stale_records': stale_count,
             'ingestion_count': ingestion.ingestion_count,
             'parameters': {
@@ -609,17 +958,17 @@ def lambda_handler(event, context):
         
         return {
             'statusCode': 200,
-            'body': json.dumps(result)
+            'body': orjson.dumps(result).decode()
         }
         
     except Exception as e:
         logger.error(f"Error in lambda_handler: {str(e)}")
         return {
             'statusCode': 500,
-            'body': json.dumps({
+            'body': orjson.dumps({
                 'error': 'Internal server error',
                 'message': str(e)
-            })
+            }).decode()
         }
 
 
@@ -2,41 +2,96 @@ import os
 import boto3
 import json
 import logging
+from boto3.dynamodb.conditions import Key
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Initialize AWS DynamoDB client
-dynamodb = boto3.resource('dynamodb')
+# Initialize AWS DynamoDB client once per container, so warm invocations reuse
+# its connections; adaptive retries absorb throttling on the link transactions
+dynamodb = boto3.resource(
+    'dynamodb',
+    config=Config(retries={'mode': 'adaptive', 'max_attempts': 10})
+)
 table_name = os.environ.get('DYNAMODB_TABLE', 'BugTracker')
 table = dynamodb.Table(table_name)
 
+# TransactWriteItems accepts at most 100 operations per call (50 moved records)
+TRANSACT_WRITE_LIMIT = 100
+
+# Concurrent transactions used by link_bugs
+LINK_WORKERS = 4
+
+serializer = TypeSerializer()
+
+# Sparse GSI holding only unlinked Slack records: ingestion sets unlinkedFlag on
+# SL-* items and linking removes it, and items without the attribute are left
+# out of the index entirely, so listing reads only the unlinked records
+UNLINKED_INDEX = 'unlinked-index'
+UNLINKED_FLAG = 'SL'
+
+# GSI on linkedTicketId, so records soft-linked to a ticket can be found by its ID
+LINKED_INDEX = 'linked-index'
+
 
 class BugTrackerLinker:
     def __init__(self):
         self.table = table
     
-    def get_bug_details(self, ticket_id):
-        """Get all records for a specific ticket ID"""
+    def _query_all(self, **kwargs):
+        """Run a table or index query and return the items of every page"""
+        items = []
+        while True:
+            response = self.table.query(**kwargs)
+            items.extend(response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                return items
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    def get_bug_details(self, ticket_id, include_linked=False):
+        """Get all records for a specific ticket ID, plus those soft-linked to it if include_linked"""
         try:
-            response = self.table.query(
+            # Follow every page, so tickets with over 1 MB of records are read in full
+            items = self._query_all(
                 KeyConditionExpression='PK = :ticket_id',
                 ExpressionAttributeValues={
                     ':ticket_id': ticket_id
                 }
             )
-            return response.get('Items', [])
         except Exception as e:
             logger.error(f"Error getting bug details: {str(e)}")
             return []
+        
+        if include_linked:
+            # Soft links are extra: if linked-index cannot be read (not created
+            # yet, throttled) the ticket's own records are still returned
+            try:
+                items.extend(self._query_all(
+                    IndexName=LINKED_INDEX,
+                    KeyConditionExpression=Key('linkedTicketId').eq(ticket_id)
+                ))
+            except Exception as e:
+                logger.warning(f"Error getting records soft-linked to {ticket_id}: {str(e)}")
+        return items
     
     def link_bugs(self, old_ticket_id, new_ticket_id):
         """
         Link bugs by updating the PK (ticketId).
         This implements the "one-time migration item" from the update strategy.
         """
+        # A transaction may not touch the same item twice
+        if old_ticket_id == new_ticket_id:
+            return {
+                'success': False,
+                'message': f'Ticket {old_ticket_id} cannot be linked to itself',
+                'linked_count': 0
+            }
+        
         try:
             # Get all records for the old ticket ID
             old_records = self.get_bug_details(old_ticket_id)
@@ -51,30 +106,68 @@ class BugTrackerLinker:
             
             logger.info(f"Linking {len(old_records)} records from {old_ticket_id} to {new_ticket_id}")
             
-            linked_count = 0
-            # Update each record with the new ticket ID
+            now = datetime.now().isoformat()
+            # Each record moves as a delete of the old item plus a put of the new one
+            transact_items = []
             for record in old_records:
-                try:
-                    # Create new item with updated PK
-                    new_item = record.copy()
-                    new_item['PK'] = new_ticket_id
-                    new_item['updatedAt'] = datetime.now().isoformat()
-                    
-                    # Delete old item and insert new item
-                    self.table.delete_item(
-                        Key={
-                            'PK': old_ticket_id,
-                            'SK': record['SK']
+                # Create new item with updated PK
+                new_item = {**record, 'PK': new_ticket_id, 'updatedAt': now}
+                if not new_ticket_id.startswith('SL-'):
+                    # Linked now, so drop it from the unlinked index
+                    new_item.pop('unlinkedFlag', None)
+                transact_items.append({
+                    'Delete': {
+                        'TableName': self.table.name,
+                        'Key': {
+                            'PK': serializer.serialize(old_ticket_id),
+                            'SK': serializer.serialize(record['SK'])
                         }
-                    )
-                    
-                    self.table.put_item(Item=new_item)
-                    linked_count += 1
-                    logger.info(f"Updated: {record['SK']}")
-                    
-                except Exception as e:
-                    logger.error(f"Error updating record {record['SK']}: {str(e)}")
-                    continue
+                    }
+                })
+                transact_items.append({
+                    'Put': {
+                        'TableName': self.table.name,
+                        'Item': {key: serializer.serialize(value) for key, value in new_item.items()}
+                    }
+                })
+            
+            # Each chunk is all-or-nothing, so a failure never leaves a record
+            # deleted without its replacement; chunks touch disjoint keys and
+            # can run in parallel
+            chunks = [
+                transact_items[i:i + TRANSACT_WRITE_LIMIT]
+                for i in range(0, len(transact_items), TRANSACT_WRITE_LIMIT)
+            ]
+            linked_count = 0
+            failed_sks = []
+            with ThreadPoolExecutor(max_workers=LINK_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.table.meta.client.transact_write_items, TransactItems=chunk): [
+                        op['Delete']['Key']['SK']['S'] for op in chunk if 'Delete' in op
+                    ]
+                    for chunk in chunks
+                }
+                for future in as_completed(futures):
+                    sks = futures[future]
+                    try:
+                        future.result()
+                        linked_count += len(sks)
+                    except Exception as e:
+                        logger.error(f"Error moving {len(sks)} records: {str(e)}")
+                        failed_sks.extend(sks)
+            
+            # A failed chunk leaves its records under the old ticket ID, so the
+            # link is incomplete and the caller has to retry it
+            if failed_sks:
+                logger.error(f"Linked {linked_count} of {len(old_records)} records to {new_ticket_id}; not moved: {failed_sks}")
+                return {
+                    'success': False,
+                    'message': f'Linked {linked_count} of {len(old_records)} records to {new_ticket_id}; retry to move the rest',
+                    'linked_count': linked_count,
+                    'failed_sks': failed_sks,
+                    'old_ticket_id': old_ticket_id,
+                    'new_ticket_id': new_ticket_id
+                }
             
             logger.info(f"Successfully linked {linked_count} records to {new_ticket_id}")
             return {
@@ -93,6 +186,90 @@ class BugTrackerLinker:
                 'linked_count': 0
             }
     
+    def soft_link_bugs(self, old_ticket_id, new_ticket_id):
+        """
+        Link bugs without moving them: set linkedTicketId on each record in place.
+        One UpdateItem per record, with no delete/put window. Use link_bugs when
+        consumers need the records under the new PK.
+        """
+        if old_ticket_id == new_ticket_id:
+            return {
+                'success': False,
+                'message': f'Ticket {old_ticket_id} cannot be linked to itself',
+                'linked_count': 0
+            }
+        
+        try:
+            old_records = self.get_bug_details(old_ticket_id)
+            
+            if not old_records:
+                logger.warning(f"No records found for ticket ID: {old_ticket_id}")
+                return {
+                    'success': False,
+                    'message': f'No records found for ticket ID: {old_ticket_id}',
+                    'linked_count': 0
+                }
+            
+            logger.info(f"Soft-linking {len(old_records)} records from {old_ticket_id} to {new_ticket_id}")
+            
+            now = datetime.now().isoformat()
+            update_expression = 'SET linkedTicketId = :new_ticket_id, updatedAt = :now'
+            if not new_ticket_id.startswith('SL-'):
+                # Linked to a real ticket now, so drop it from the unlinked index
+                # (as link_bugs does; a link to another SL-* ticket keeps it)
+                update_expression += ' REMOVE unlinkedFlag'
+            
+            def update(record):
+                # The record may have been deleted or re-keyed by link_bugs since
+                # it was read; the condition stops UpdateItem creating a stub item,
+                # and the failure is reported with the other failed records
+                self.table.update_item(
+                    Key={'PK': old_ticket_id, 'SK': record['SK']},
+                    UpdateExpression=update_expression,
+                    ConditionExpression='attribute_exists(PK)',
+                    ExpressionAttributeValues={':new_ticket_id': new_ticket_id, ':now': now}
+                )
+            
+            linked_count = 0
+            failed_sks = []
+            with ThreadPoolExecutor(max_workers=LINK_WORKERS) as executor:
+                futures = {executor.submit(update, record): record['SK'] for record in old_records}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        linked_count += 1
+                    except Exception as e:
+                        logger.error(f"Error updating record {futures[future]}: {str(e)}")
+                        failed_sks.append(futures[future])
+            
+            if failed_sks:
+                logger.error(f"Soft-linked {linked_count} of {len(old_records)} records to {new_ticket_id}; not updated: {failed_sks}")
+                return {
+                    'success': False,
+                    'message': f'Soft-linked {linked_count} of {len(old_records)} records to {new_ticket_id}; retry to link the rest',
+                    'linked_count': linked_count,
+                    'failed_sks': failed_sks,
+                    'old_ticket_id': old_ticket_id,
+                    'new_ticket_id': new_ticket_id
+                }
+            
+            logger.info(f"Successfully soft-linked {linked_count} records to {new_ticket_id}")
+            return {
+                'success': True,
+                'message': f'Successfully soft-linked {linked_count} records to {new_ticket_id}',
+                'linked_count': linked_count,
+                'old_ticket_id': old_ticket_id,
+                'new_ticket_id': new_ticket_id
+            }
+            
+        except Exception as e:
+            logger.error(f"Error soft-linking bugs: {str(e)}")
+            return {
+                'success': False,
+                'message': f'Error soft-linking bugs: {str(e)}',
+                'linked_count': 0
+            }
+    
     def create_synthetic_ticket(self, slack_msg_id, zendesk_ticket_id):
         """
         Create a synthetic ticket ID when PM links a real Zendesk ticket.
@@ -102,8 +279,8 @@ class BugTrackerLinker:
         return self.link_bugs(synthetic_id, zendesk_ticket_id)
     
     def show_bug_summary(self, ticket_id):
-        """Show a summary of all records for a ticket ID"""
-        records = self.get_bug_details(ticket_id)
+        """Show a summary of all records for a ticket ID, including soft-linked ones"""
+        records = self.get_bug_details(ticket_id, include_linked=True)
         
         if not records:
             return {
@@ -147,17 +324,18 @@ class BugTrackerLinker:
     def list_unlinked_slack_bugs(self):
         """List Slack bugs that don't have Zendesk tickets linked"""
         try:
-            response = self.table.query(
-                IndexName='source-index',
-                KeyConditionExpression='sourceSystem = :source_system',
-                FilterExpression='begins_with(PK, :sl_prefix)',
-                ExpressionAttributeValues={
-                    ':source_system': 'slack',
-                    ':sl_prefix': 'SL-'
-                }
-            )
-            
-            unlinked_bugs = response.get('Items', [])
+            # Every item in the sparse index is unlinked, so no filter is needed
+            query_kwargs = {
+                'IndexName': UNLINKED_INDEX,
+                'KeyConditionExpression': Key('unlinkedFlag').eq(UNLINKED_FLAG)
+            }
+            unlinked_bugs = []
+            while True:
+                response = self.table.query(**query_kwargs)
+                unlinked_bugs.extend(response.get('Items', []))
+                if 'LastEvaluatedKey' not in response:
+                    break
+                query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
             
             if not unlinked_bugs:
                 return {
@@ -224,6 +402,20 @@ def lambda_handler(event, context):
             
             result = linker.link_bugs(old_ticket_id, new_ticket_id)
             
+        elif action == 'soft_link_bugs':
+            old_ticket_id = body.get('old_ticket_id')
+            new_ticket_id = body.get('new_ticket_id')
+            
+            if not old_ticket_id or not new_ticket_id:
+                return {
+                    'statusCode': 400,
+                    'body': json.dumps({
+                        'error': 'Missing required parameters: old_ticket_id and new_ticket_id'
+                    })
+                }
+            
+            result = linker.soft_link_bugs(old_ticket_id, new_ticket_id)
+            
         elif action == 'create_synthetic_link':
             slack_msg_id = body.get('slack_msg_id')
             zendesk_ticket_id = body.get('zendesk_ticket_id')
@@ -261,7 +453,7 @@ def lambda_handler(event, context):
             return {
                 'statusCode': 400,
                 'body': json.dumps({
-                    'error': 'Invalid action. Supported actions: link_bugs, create_synthetic_link, show_bug_summary, list_unlinked_slack_bugs'
+                    'error': 'Invalid action. Supported actions: link_bugs, soft_link_bugs, create_synthetic_link, show_bug_summary, list_unlinked_slack_bugs'
                 })
             }
         
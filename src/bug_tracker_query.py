@@ -1,4 +1,5 @@
 import os
+import re
 import boto3
 import json
 import logging
@@ -43,6 +44,10 @@ SHORTCUT_STATUS_MAPPING = {
     "500012489": "3rd Refinement"
 }
 
+# Zendesk references in Slack text, compiled once with the flag baked in
+ZENDESK_TICKET_RE = re.compile(r'zendesk ticket[:\s]*(\d+)', re.IGNORECASE)
+ZD_ID_RE = re.compile(r'zd-(\d+)', re.IGNORECASE)
+
 
 def translate_shortcut_item(item):
     """Translate Shortcut IDs to readable names for a single item"""
@@ -738,10 +743,9 @@ class TicketFlowAnalytics:
             slack_text = slack_ticket.get('text', '').lower()
             if 'zendesk ticket:' in slack_text or 'zd-' in slack_text:
                 # Extract potential Zendesk ticket ID
-                import re
-                zd_match = re.search(r'zendesk ticket[:\s]*(\d+)', slack_text, re.IGNORECASE)
+                zd_match = ZENDESK_TICKET_RE.search(slack_text)
                 if not zd_match:
-                    zd_match = re.search(r'zd-(\d+)', slack_text, re.IGNORECASE)
+                    zd_match = ZD_ID_RE.search(slack_text)
                 
                 if zd_match:
                     zd_id = zd_match.group(1)
@@ -19,6 +19,8 @@ table = dynamodb.Table(DYNAMODB_TABLE)
 class BugLinker:
     def __init__(self):
         self.table = table
+        # Ticket ID -> records, dropped again when link_bugs re-keys them
+        self._cache = {}
     
     def find_bugs_by_source(self, source_system, limit=10):
         """Find bugs from a specific source system"""
@@ -38,6 +40,9 @@ class BugLinker:
     
     def get_bug_details(self, ticket_id):
         """Get all records for a specific ticket ID"""
+        if ticket_id in self._cache:
+            return self._cache[ticket_id]
+        
         try:
             response = self.table.query(
                 KeyConditionExpression='PK = :ticket_id',
@@ -45,7 +50,9 @@ class BugLinker:
                     ':ticket_id': ticket_id
                 }
             )
-            return response.get('Items', [])
+            items = response.get('Items', [])
+            self._cache[ticket_id] = items
+            return items
         except Exception as e:
             print(f"❌ Error getting bug details: {str(e)}")
             return []
@@ -63,25 +70,37 @@ class BugLinker:
                 print(f"❌ No records found for ticket ID: {old_ticket_id}")
                 return False
             
+            if old_ticket_id == new_ticket_id:
+                print(f"ℹ️  {old_ticket_id} is already the ticket ID, nothing to link")
+                return True
+            
             print(f"🔗 Linking {len(old_records)} records from {old_ticket_id} to {new_ticket_id}")
             
-            # Update each record with the new ticket ID
-            for record in old_records:
-                # Create new item with updated PK
-                new_item = record.copy()
-                new_item['PK'] = new_ticket_id
-                new_item['updatedAt'] = datetime.now().isoformat()
-                
-                # Delete old item and insert new item
-                self.table.delete_item(
-                    Key={
-                        'PK': old_ticket_id,
-                        'SK': record['SK']
-                    }
-                )
-                
-                self.table.put_item(Item=new_item)
-                print(f"  ✅ Updated: {record['SK']}")
+            now = datetime.now().isoformat()
+            
+            # Re-key every record in one batch pass: puts and deletes are grouped
+            # into 25-item BatchWriteItem calls. BatchWriteItem cannot carry
+            # condition expressions, so optimistic locking would need put_item.
+            try:
+                with self.table.batch_writer() as batch:
+                    for record in old_records:
+                        new_item = {**record, 'PK': new_ticket_id, 'updatedAt': now}
+                        if not new_ticket_id.startswith('SL-'):
+                            # Linked now, so drop it from the sparse unlinked-index
+                            new_item.pop('unlinkedFlag', None)
+                        batch.put_item(Item=new_item)
+                        batch.delete_item(
+                            Key={
+                                'PK': old_ticket_id,
+                                'SK': record['SK']
+                            }
+                        )
+                        print(f"  ✅ Updated: {record['SK']}")
+            finally:
+                # Both tickets' records changed, even if the batch failed partway,
+                # so re-query them next time
+                self._cache.pop(old_ticket_id, None)
+                self._cache.pop(new_ticket_id, None)
             
             print(f"🎯 Successfully linked {len(old_records)} records to {new_ticket_id}")
             return True
@@ -135,7 +154,11 @@ class BugLinker:
             response = self.table.query(
                 IndexName='source-index',
                 KeyConditionExpression='sourceSystem = :source_system',
+                # Linked Slack rows are re-keyed to ZD-*, so the PK prefix is what
+                # marks a row as unlinked; only fetch what the listing prints
                 FilterExpression='begins_with(PK, :sl_prefix)',
+                ProjectionExpression='PK, #t, createdAt',
+                ExpressionAttributeNames={'#t': 'text'},
                 ExpressionAttributeValues={
                     ':source_system': 'slack',
                     ':sl_prefix': 'SL-'
@@ -1,5 +1,6 @@
 import os
 import re
+import hashlib
 import requests
 from datetime import datetime
 from dotenv import load_dotenv
@@ -19,6 +20,15 @@ ZENDESK_API_TOKEN = os.getenv("ZENDESK_API_TOKEN")
 # Shortcut config
 SHORTCUT_API_TOKEN = os.getenv("SHORTCUT_API_TOKEN")
 
+# Slack message fields, compiled once with the case-insensitive flag baked in
+TICKET_ID_RE = re.compile(r"ticketId[:=]\s*(\S+)", re.IGNORECASE)
+PRIORITY_RE = re.compile(r"priority[:=]\s*(\S+)", re.IGNORECASE)
+
+
+def text_digest(text):
+    """Stable 64-bit BLAKE2b hex digest of text, the same in every process (unlike hash())."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
 
 # ==============================
 # DynamoDB (Stub)
@@ -35,10 +45,10 @@ def upsert_bug_item(ticket_id, source, attributes):
 # ==============================
 def extract_ticket_info_from_slack(text):
     """Extract ticketId and priority if available, fallback if not."""
-    ticket_pattern = re.search(r"ticketId[:=]\s*(\S+)", text, re.IGNORECASE)
-    priority_pattern = re.search(r"priority[:=]\s*(\S+)", text, re.IGNORECASE)
+    ticket_pattern = TICKET_ID_RE.search(text)
+    priority_pattern = PRIORITY_RE.search(text)
 
-    ticket_id = ticket_pattern.group(1) if ticket_pattern else f"GENERIC-{hash(text)}"
+    ticket_id = ticket_pattern.group(1) if ticket_pattern else f"GENERIC-{text_digest(text)}"
     priority = priority_pattern.group(1).capitalize() if priority_pattern else "Unknown"
 
     return ticket_id, priority
@@ -60,13 +70,16 @@ def fetch_slack_messages():
         for msg in messages:
             text = msg.get("text", "")
             ticket_id, priority = extract_ticket_info_from_slack(text)
+            msg_id = msg.get("ts")
+            if not msg_id:
+                continue
 
             bug_data = {
                 "author": msg.get("user", "unknown"),
                 "text": text,
                 "priority": priority,
-                "slack_msg_id": msg.get("ts"),
-                "created_at": datetime.fromtimestamp(float(msg["ts"])).isoformat(),
+                "slack_msg_id": msg_id,
+                "created_at": datetime.fromtimestamp(float(msg_id)).isoformat(),
                 "source_system": "slack"
             }
             upsert_bug_item(ticket_id, "slack", bug_data)
@@ -85,17 +98,19 @@ def fetch_slack_messages():
 def fetch_zendesk_tickets():
     """Fetch Zendesk tickets and normalize into bug records."""
     try:
-        url = f"https://{ZENDESK_SUBDOMAIN}.zendesk.com/api/v2/tickets.json"
+        # Let Zendesk filter to bug-tagged tickets instead of downloading them all
+        url = f"https://{ZENDESK_SUBDOMAIN}.zendesk.com/api/v2/search.json"
+        params = {"query": "type:ticket tags:bug"}
         auth = (f"{ZENDESK_EMAIL}/token", ZENDESK_API_TOKEN)
-        response = requests.get(url, auth=auth, timeout=10)
+        response = requests.get(url, params=params, auth=auth, timeout=10)
         response.raise_for_status()
 
         data = response.json()
-        tickets = data.get("tickets", [])
+        tickets = data.get("results", [])
         results = []
 
         for t in tickets:
-            if "bug" not in (t.get("tags") or []):  # filter only bug tickets
+            if "bug" not in (t.get("tags") or ()):  # guard; the search already filters on the tag
                 continue
 
             ticket_id = f"ZD-{t['id']}"
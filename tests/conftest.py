@@ -0,0 +1,9 @@
+import os
+import sys
+
+# The Lambda code lives in src/, the maintenance scripts at the repo root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'src'), ROOT]
+
+# Modules build their boto3 handles at import time; no AWS call is made
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-west-2')
@@ -0,0 +1,176 @@
+"""
+Tests for the shared DynamoDB helpers in _aws.py, run against in-memory fakes.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import _aws
+
+
+class FakeClient:
+    """Records BatchWriteItem calls; throttle_calls leaves every item unprocessed that many times"""
+
+    def __init__(self, throttle_calls=0):
+        self.throttle_calls = throttle_calls
+        self.written = []
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def batch_write_item(self, RequestItems):
+        with self._lock:
+            self.calls += 1
+            if self.throttle_calls:
+                self.throttle_calls -= 1
+                return {'UnprocessedItems': RequestItems}
+            for requests in RequestItems.values():
+                self.written.extend(requests)
+        return {'UnprocessedItems': {}}
+
+
+def fake_table(client=None, scan=None):
+    return SimpleNamespace(name='BugTracker', meta=SimpleNamespace(client=client), scan=scan)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(_aws.time, 'sleep', lambda seconds: None)
+
+
+def test_batch_delete_keys_writes_every_key():
+    client = FakeClient()
+    keys = [(f'SL-{i}', 'slack') for i in range(103)]
+
+    counts = list(_aws.batch_delete_keys(fake_table(client), iter(keys), max_workers=4))
+
+    assert counts[-1] == 103
+    assert counts == sorted(counts)
+    assert client.calls == 5
+    deleted = sorted(request['DeleteRequest']['Key']['PK']['S'] for request in client.written)
+    assert deleted == sorted(pk for pk, _ in keys)
+
+
+def test_batch_put_items_serializes_items():
+    client = FakeClient()
+    items = [{'PK': 'ZD-1', 'SK': 'zendesk', 'count': 3, 'open': True}]
+
+    assert list(_aws.batch_put_items(fake_table(client), items)) == [1]
+    assert client.written == [{'PutRequest': {'Item': {
+        'PK': {'S': 'ZD-1'}, 'SK': {'S': 'zendesk'}, 'count': {'N': '3'}, 'open': {'BOOL': True}
+    }}}]
+
+
+def test_batch_write_with_no_items():
+    client = FakeClient()
+
+    assert list(_aws.batch_delete_keys(fake_table(client), [])) == []
+    assert client.calls == 0
+
+
+def test_write_batch_retries_unprocessed_items():
+    client = FakeClient(throttle_calls=2)
+
+    assert _aws._write_batch(client, {'BugTracker': [{'DeleteRequest': {}}]}) == 2
+    assert client.calls == 3
+    assert len(client.written) == 1
+
+
+def test_write_batch_gives_up_after_max_attempts():
+    client = FakeClient(throttle_calls=100)
+
+    with pytest.raises(RuntimeError, match='1 write requests still unprocessed'):
+        _aws._write_batch(client, {'BugTracker': [{'DeleteRequest': {}}]}, max_attempts=3)
+    assert client.calls == 3
+
+
+def test_batch_write_surfaces_retry_cap():
+    client = FakeClient(throttle_calls=100)
+
+    with pytest.raises(RuntimeError):
+        list(_aws.batch_delete_keys(fake_table(client), [('SL-1', 'slack')]))
+
+
+def paged_operation(pages):
+    """A scan/query stand-in returning pages in order and recording each call's kwargs"""
+    calls = []
+
+    def operation(**kwargs):
+        calls.append(kwargs)
+        return pages[len(calls) - 1]
+
+    return operation, calls
+
+
+def test_rate_limited_pages_follows_last_evaluated_key():
+    pages = [
+        {'Items': [1], 'LastEvaluatedKey': {'PK': 'a'}},
+        {'Items': [2], 'LastEvaluatedKey': {'PK': 'b'}},
+        {'Items': [3]},
+    ]
+    operation, calls = paged_operation(pages)
+
+    assert list(_aws.rate_limited_pages(operation, Limit=1)) == pages
+    assert calls[0] == {'Limit': 1}
+    assert calls[1]['ExclusiveStartKey'] == {'PK': 'a'}
+    assert calls[2]['ExclusiveStartKey'] == {'PK': 'b'}
+
+
+def test_rate_limited_pages_sleeps_to_target_rcu(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(_aws.time, 'sleep', sleeps.append)
+    monkeypatch.setattr(_aws.time, 'monotonic', lambda: 0.0)
+    pages = [
+        {'Items': [], 'ConsumedCapacity': {'CapacityUnits': 50}, 'LastEvaluatedKey': {'PK': 'a'}},
+        {'Items': [], 'ConsumedCapacity': {'CapacityUnits': 25}},
+    ]
+    operation, calls = paged_operation(pages)
+
+    list(_aws.rate_limited_pages(operation, target_rcu=100))
+
+    assert sleeps == [0.5, 0.25]
+    assert all(call['ReturnConsumedCapacity'] == 'TOTAL' for call in calls)
+
+
+def segmented_scan(pages_per_segment, fail_segment=None):
+    """A table.scan stand-in returning pages_per_segment pages for each segment"""
+
+    def scan(Segment, TotalSegments, ExclusiveStartKey=None, **kwargs):
+        if Segment == fail_segment:
+            raise RuntimeError(f'segment {Segment} failed')
+        page = ExclusiveStartKey['page'] + 1 if ExclusiveStartKey else 0
+        response = {'Items': [(Segment, page)]}
+        if page + 1 < pages_per_segment:
+            response['LastEvaluatedKey'] = {'page': page}
+        return response
+
+    return scan
+
+
+def test_parallel_scan_pages_yields_every_segment():
+    table = fake_table(scan=segmented_scan(3))
+
+    items = [
+        item
+        for page in _aws.parallel_scan_pages(table, total_segments=4, max_pending_pages=2)
+        for item in page['Items']
+    ]
+
+    assert sorted(items) == [(segment, page) for segment in range(4) for page in range(3)]
+
+
+def test_parallel_scan_pages_surfaces_segment_errors():
+    table = fake_table(scan=segmented_scan(3, fail_segment=2))
+
+    with pytest.raises(RuntimeError, match='segment 2 failed'):
+        list(_aws.parallel_scan_pages(table, total_segments=4))
+
+
+def test_parallel_scan_pages_stops_when_consumer_stops():
+    table = fake_table(scan=segmented_scan(1000))
+    pages = _aws.parallel_scan_pages(table, total_segments=4, max_pending_pages=2)
+
+    assert next(pages)['Items']
+    # Closing must release the scanners blocked on the full queue
+    pages.close()
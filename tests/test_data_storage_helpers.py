@@ -0,0 +1,159 @@
+"""
+Tests for the streaming and rate-limiting helpers in dynamodb_data_storage.py.
+"""
+
+import io
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import dynamodb_data_storage as storage
+
+
+def streamed_response(body):
+    """A requests.Response stand-in for stream=True: only .raw is read"""
+    return SimpleNamespace(raw=io.BytesIO(json.dumps(body).encode('utf-8')))
+
+
+def test_iter_json_arrays_yields_elements_and_collects_meta():
+    body = {
+        'tickets': [{'id': 1, 'tags': ['a', 'b']}, {'id': 2, 'via': {'channel': 'web'}}],
+        'users': [{'id': 10, 'name': 'Ann'}],
+        'end_of_stream': False,
+        'after_cursor': 'abc',
+        'count': 2,
+    }
+    meta = {}
+
+    elements = list(storage.iter_json_arrays(streamed_response(body), ('tickets', 'users'), meta))
+
+    assert elements == [
+        ('tickets', {'id': 1, 'tags': ['a', 'b']}),
+        ('tickets', {'id': 2, 'via': {'channel': 'web'}}),
+        ('users', {'id': 10, 'name': 'Ann'}),
+    ]
+    assert meta == {'end_of_stream': False, 'after_cursor': 'abc', 'count': 2}
+
+
+def test_iter_json_arrays_reads_top_level_array():
+    body = [{'id': 1}, 'plain', [1, [2]], None]
+
+    elements = list(storage.iter_json_arrays(streamed_response(body), ('',), {}))
+
+    assert elements == [('', {'id': 1}), ('', 'plain'), ('', [1, [2]]), ('', None)]
+
+
+def test_iter_json_arrays_skips_other_arrays():
+    body = {'tickets': [{'id': 1}], 'groups': [{'id': 5}], 'next_page': None}
+    meta = {}
+
+    elements = list(storage.iter_json_arrays(streamed_response(body), ('tickets',), meta))
+
+    assert elements == [('tickets', {'id': 1})]
+    assert meta == {'next_page': None}
+
+
+def test_merge_streams_yields_every_record():
+    fetchers = [
+        lambda: iter(range(0, 100)),
+        lambda: iter(range(100, 150)),
+        lambda: iter([]),
+    ]
+
+    assert sorted(storage.merge_streams(fetchers, max_pending=5)) == list(range(150))
+
+
+def test_merge_streams_surfaces_fetcher_errors():
+    def failing():
+        yield 1
+        raise ValueError('fetch failed')
+
+    with pytest.raises(ValueError, match='fetch failed'):
+        list(storage.merge_streams([failing, lambda: iter(range(10))]))
+
+
+def test_merge_streams_stops_fetchers_when_consumer_stops():
+    stopped = threading.Event()
+
+    def endless():
+        try:
+            count = 0
+            while True:
+                yield count
+                count += 1
+        finally:
+            stopped.set()
+
+    records = storage.merge_streams([endless], max_pending=2)
+    assert next(records) == 0
+    records.close()
+
+    assert stopped.wait(5)
+
+
+def test_rate_limiter_spaces_calls(monkeypatch):
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(storage.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(storage.time, 'sleep', sleep)
+    limiter = storage.RateLimiter(rate=4)
+
+    for _ in range(5):
+        limiter.acquire()
+
+    # The burst token is free, then one call every 1/rate seconds
+    assert sleeps == pytest.approx([0.25] * 4)
+
+
+def test_rate_limiter_refills_while_idle(monkeypatch):
+    clock = [0.0]
+    sleeps = []
+    monkeypatch.setattr(storage.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(storage.time, 'sleep', sleeps.append)
+    limiter = storage.RateLimiter(rate=2, burst=2)
+
+    limiter.acquire()
+    limiter.acquire()
+    clock[0] += 10
+    limiter.acquire()
+    limiter.acquire()
+
+    # Idle time refills at most `burst` tokens
+    assert sleeps == []
+    limiter.acquire()
+    assert sleeps == pytest.approx([0.5])
+
+
+def test_rate_limiter_pause_holds_back_next_call(monkeypatch):
+    clock = [0.0]
+    sleeps = []
+    monkeypatch.setattr(storage.time, 'monotonic', lambda: clock[0])
+    monkeypatch.setattr(storage.time, 'sleep', sleeps.append)
+    limiter = storage.RateLimiter(rate=1)
+
+    limiter.pause(3)
+    limiter.acquire()
+
+    assert sleeps == pytest.approx([4.0])
+
+
+def test_rate_limiter_is_shared_across_threads():
+    limiter = storage.RateLimiter(rate=50)
+    start = time.monotonic()
+
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(11)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One free token, then ten more at 50 per second
+    assert time.monotonic() - start >= 0.19
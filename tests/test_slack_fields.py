@@ -0,0 +1,106 @@
+"""
+Parity tests for the single-pass Slack field regex: extract_ticket_info_from_slack
+must return exactly what the original one-pattern-per-field version did.
+"""
+
+import hashlib
+import random
+import re
+
+import pytest
+
+from bug_tracker_ingestion import BugTrackerIngestion
+
+# The per-field patterns extract_ticket_info_from_slack used before the fused regex
+_BASELINE_PATTERNS = {
+    'ticketid': re.compile(r"ticketId[:=]\s*(\S+)", re.IGNORECASE),
+    'zendesk_ticket': re.compile(r"zendesk\s*ticket[:=]\s*(\S+)", re.IGNORECASE),
+    'priority': re.compile(r"priority[:=]\s*(\S+)", re.IGNORECASE),
+    'status': re.compile(r"status[:=]\s*(\S+)", re.IGNORECASE),
+    'state': re.compile(r"state[:=]\s*(\S+)", re.IGNORECASE),
+    'assignee': re.compile(r"assignee[:=]\s*(\S+)", re.IGNORECASE),
+}
+
+
+def baseline_extract(text):
+    """The original extract_ticket_info_from_slack, one re.search per field"""
+    fields = {}
+    for key, pattern in _BASELINE_PATTERNS.items():
+        match = pattern.search(text)
+        if match:
+            fields[key] = match.group(1)
+
+    subject = text.split('\n')[0][:100] if text else "Slack Message"
+
+    if 'zendesk_ticket' in fields:
+        ticket_id = fields['zendesk_ticket']
+        if not ticket_id.upper().startswith('ZD-'):
+            ticket_id = f"ZD-{ticket_id}"
+    elif 'ticketid' in fields:
+        ticket_id = fields['ticketid']
+    else:
+        ticket_id = f"SL-{hashlib.md5(text.encode('utf-8')).hexdigest()[:12]}"
+
+    return {
+        'ticket_id': ticket_id,
+        'priority': fields['priority'].capitalize() if 'priority' in fields else "Medium",
+        'status': fields['status'].capitalize() if 'status' in fields else "Open",
+        'state': fields['state'].capitalize() if 'state' in fields else "open",
+        'subject': subject,
+        'assignee': fields.get('assignee'),
+    }
+
+
+@pytest.fixture(scope='module')
+def ingestion():
+    return BugTrackerIngestion()
+
+
+@pytest.mark.parametrize('text', [
+    # Packed fields with no whitespace between them
+    "priority:high,status:open",
+    "priority=high;status=closed;assignee=bob",
+    # 'zendesk ticketid:' is a ticketId, not a Zendesk ticket
+    "zendesk ticketid: 123",
+    "Zendesk Ticket: 4567\nticketId: 89",
+    "zendesk ticket: ZD-42",
+    "ZendeskTicket=zd-7 priority: low",
+    # state and status are separate fields
+    "state: resolved status: pending",
+    "status:state:done",
+    "STATE=Closed",
+    # casefold changes the length, so offsets differ from the text
+    "Straße priority: HIGH",
+    "ẞ status: Straße assignee: ß",
+    "ﬁx priority:ﬂow",
+    "İstanbul ticketid: İ-1",
+    # Values separated by newlines and repeated keys (the first one wins)
+    "Bug report\npriority:\n  urgent\npriority: low",
+    "status: open status: closed",
+    # Keys with nothing after them
+    "priority:",
+    "status:   ",
+    # No keywords at all
+    "",
+    "just a regular message",
+    "deploy finished in 3m",
+])
+def test_matches_baseline(ingestion, text):
+    assert ingestion.extract_ticket_info_from_slack(text) == baseline_extract(text)
+
+
+def test_matches_baseline_on_random_text(ingestion):
+    # Fragments biased towards keys, separators and case-folding edge cases
+    fragments = [
+        'priority', 'PRIORITY', 'status', 'State', 'stat', 'ticketid', 'ticketId',
+        'zendesk', 'Zendesk ', 'ticket', 'assignee', 'ASSIGNEE',
+        'us', 'e', 'tatus', 'ticketi', 'd', 'D',
+        ':', '=', ' ', '  ', '\n', '\t', ',', ';',
+        'high', 'open', 'ZD-1', 'zd-2', '123', 'x',
+        'ß', 'ẞ', 'ﬁ', 'İ', 'ı', 'ſ', 'K', 'Σ', 'ς',
+    ]
+    rng = random.Random(20240501)
+
+    for _ in range(5000):
+        text = ''.join(rng.choice(fragments) for _ in range(rng.randint(0, 12)))
+        assert ingestion.extract_ticket_info_from_slack(text) == baseline_extract(text), text